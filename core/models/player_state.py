@@ -1,22 +1,141 @@
 """
 Data models for CS2 player state from GSI.
 """
-from dataclasses import dataclass
-from typing import Dict, Optional
-from enum import Enum
+import re
+from functools import lru_cache
+from dataclasses import dataclass, field
+from typing import Dict, Optional, Tuple
+from enum import IntEnum
 
 
-class WeaponCategory(Enum):
+class WeaponCategory(IntEnum):
     """Weapon categories for RCS eligibility."""
-    PRIMARY = "primary"
-    SECONDARY = "secondary"
-    MELEE = "melee"
-    GRENADE = "grenade"
-    C4 = "c4"
-    UNKNOWN = "unknown"
-
-
-@dataclass
+    UNKNOWN = 0
+    PRIMARY = 1
+    SECONDARY = 2
+    MELEE = 3
+    GRENADE = 4
+    C4 = 5
+
+
+# Primary weapons eligible for RCS
+_PRIMARY_WEAPONS = (
+    "ak47", "m4a1", "m4a4", "awp", "scar20", "g3sg1",
+    "famas", "galil", "aug", "sg556", "ssg08",
+    "p90", "mp5", "mp7", "mp9", "mac10", "ump45", "bizon",
+    "nova", "mag7", "sawed", "xm1014", "m249", "negev"
+)
+
+# Secondary weapons (pistols) - not eligible for RCS
+_SECONDARY_WEAPONS = (
+    "glock", "usp", "p2000", "p250", "fiveseven", "tec9",
+    "deagle", "revolver", "dualies"
+)
+
+_GRENADE_TYPES = (
+    "grenade", "flashbang", "smoke", "molotov", "incgrenade", "decoy"
+)
+
+# Single-pass substring matchers for each token group
+_PRIMARY_RE = re.compile("|".join(map(re.escape, _PRIMARY_WEAPONS)))
+_SECONDARY_RE = re.compile("|".join(map(re.escape, _SECONDARY_WEAPONS)))
+_GRENADE_RE = re.compile("|".join(map(re.escape, _GRENADE_TYPES)))
+
+# Exact categories for known CS2 entity tokens (name without "weapon_")
+_TOKEN_TO_CATEGORY: Dict[str, WeaponCategory] = {
+    **dict.fromkeys((
+        "ak47", "m4a1", "m4a1_silencer", "famas", "galilar", "aug", "sg556",
+        "awp", "ssg08", "scar20", "g3sg1", "p90", "mp5sd", "mp7", "mp9",
+        "mac10", "ump45", "bizon", "nova", "mag7", "sawedoff", "xm1014",
+        "m249", "negev", "cz75a"
+    ), WeaponCategory.PRIMARY),
+    **dict.fromkeys((
+        "glock", "hkp2000", "usp_silencer", "p250", "fiveseven", "tec9",
+        "deagle", "revolver"
+    ), WeaponCategory.SECONDARY),
+    **dict.fromkeys((
+        "hegrenade", "flashbang", "smokegrenade", "molotov", "incgrenade",
+        "decoy"
+    ), WeaponCategory.GRENADE),
+    "c4": WeaponCategory.C4,
+}
+
+# Pattern file name per GSI weapon entity name
+_WEAPON_PATTERN_MAP: Dict[str, str] = {
+    "weapon_ak47": "ak47",
+    "weapon_m4a1": "m4a4",
+    "weapon_m4a1_silencer": "m4a1",
+    "weapon_m4a4": "m4a4",
+    "weapon_famas": "famas",
+    "weapon_galilar": "galil",
+    "weapon_aug": "aug",
+    "weapon_sg556": "sg553",
+    "weapon_p90": "p90",
+    "weapon_mp5sd": "mp5sd",
+    "weapon_mp7": "mp7",
+    "weapon_mp9": "mp9",
+    "weapon_mac10": "mac10",
+    "weapon_ump45": "ump45",
+    "weapon_bizon": "bizon",
+    "weapon_m249": "m249",
+    "weapon_negev": "negev",
+    "weapon_cz75a": "cz75"
+}
+
+def _classify_weapon(name: str, weapon_type: str) -> Tuple[WeaponCategory, Optional[str]]:
+    """Resolve (category, pattern name) for a GSI weapon entity name."""
+    info = _WEAPON_INFO.get(name)
+    if info is not None:
+        return info
+
+    return _cached_weapon_category(name, weapon_type), None
+
+
+# Names outside _WEAPON_INFO come from GSI input, so the memo is bounded
+@lru_cache(maxsize=256)
+def _cached_weapon_category(name: str, weapon_type: str) -> WeaponCategory:
+    """Memoized category for a (name, type) pair outside _WEAPON_INFO."""
+    return _compute_weapon_category(name.lower(), weapon_type)
+
+
+def _compute_weapon_category(weapon_name: str, weapon_type: str) -> WeaponCategory:
+    """Classify a lowercase weapon name by substring tokens."""
+    # CZ75 exception: pistol with RCS pattern
+    if "cz75" in weapon_name:
+        return WeaponCategory.PRIMARY
+
+    if _PRIMARY_RE.search(weapon_name) is not None:
+        return WeaponCategory.PRIMARY
+
+    if _SECONDARY_RE.search(weapon_name) is not None:
+        return WeaponCategory.SECONDARY
+
+    # Melee weapons
+    if "knife" in weapon_name or weapon_type == "knife":
+        return WeaponCategory.MELEE
+
+    # Grenades
+    if _GRENADE_RE.search(weapon_name) is not None:
+        return WeaponCategory.GRENADE
+
+    # C4
+    if "c4" in weapon_name:
+        return WeaponCategory.C4
+
+    return WeaponCategory.UNKNOWN
+
+
+# (category, pattern name) per known GSI weapon entity name, built once
+_WEAPON_INFO: Dict[str, Tuple[WeaponCategory, Optional[str]]] = {
+    name: (
+        _TOKEN_TO_CATEGORY.get(name[7:]) or _compute_weapon_category(name, ""),
+        _WEAPON_PATTERN_MAP.get(name)
+    )
+    for name in (*("weapon_" + token for token in _TOKEN_TO_CATEGORY), *_WEAPON_PATTERN_MAP)
+}
+
+
+@dataclass(slots=True)
 class WeaponState:
     """Weapon state from GSI data."""
 
@@ -27,12 +146,15 @@ class WeaponState:
     ammo_clip: int
     ammo_clip_max: int
     ammo_reserve: int
+    _category: WeaponCategory = field(init=False, repr=False, compare=False)
+    _pattern_name: Optional[str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self):
-        """Ensure ammo values are non-negative."""
+        """Ensure ammo values are non-negative and resolve weapon info."""
         self.ammo_clip = max(0, self.ammo_clip)
         self.ammo_clip_max = max(0, self.ammo_clip_max)
         self.ammo_reserve = max(0, self.ammo_reserve)
+        self._category, self._pattern_name = _classify_weapon(self.name, self.type)
 
     @property
     def is_active(self) -> bool:
@@ -47,47 +169,7 @@ class WeaponState:
     @property
     def weapon_category(self) -> WeaponCategory:
         """Get weapon category for RCS logic."""
-        weapon_name = self.name.lower()
-
-        # Primary weapons eligible for RCS
-        primary_weapons = [
-            "ak47", "m4a1", "m4a4", "awp", "scar20", "g3sg1",
-            "famas", "galil", "aug", "sg556", "ssg08",
-            "p90", "mp5", "mp7", "mp9", "mac10", "ump45", "bizon",
-            "nova", "mag7", "sawed", "xm1014", "m249", "negev"
-        ]
-
-        # CZ75 exception: pistol with RCS pattern
-        if "cz75" in weapon_name:
-            return WeaponCategory.PRIMARY
-
-        if any(weapon in weapon_name for weapon in primary_weapons):
-            return WeaponCategory.PRIMARY
-
-        # Secondary weapons (pistols) - not eligible for RCS
-        secondary_weapons = [
-            "glock", "usp", "p2000", "p250", "fiveseven", "tec9",
-            "deagle", "revolver", "dualies"
-        ]
-        if any(weapon in weapon_name for weapon in secondary_weapons):
-            return WeaponCategory.SECONDARY
-
-        # Melee weapons
-        if "knife" in weapon_name or self.type == "knife":
-            return WeaponCategory.MELEE
-
-        # Grenades
-        grenade_types = [
-            "grenade", "flashbang", "smoke", "molotov", "incgrenade", "decoy"
-        ]
-        if any(grenade in weapon_name for grenade in grenade_types):
-            return WeaponCategory.GRENADE
-
-        # C4
-        if "c4" in weapon_name:
-            return WeaponCategory.C4
-
-        return WeaponCategory.UNKNOWN
+        return self._category
 
     @property
     def is_rcs_eligible(self) -> bool:
@@ -98,31 +180,10 @@ class WeaponState:
 
     def get_pattern_name(self) -> Optional[str]:
         """Get pattern file name for this weapon."""
-        weapon_pattern_map = {
-            "weapon_ak47": "ak47",
-            "weapon_m4a1": "m4a4",
-            "weapon_m4a1_silencer": "m4a1",
-            "weapon_m4a4": "m4a4",
-            "weapon_famas": "famas",
-            "weapon_galilar": "galil",
-            "weapon_aug": "aug",
-            "weapon_sg556": "sg553",
-            "weapon_p90": "p90",
-            "weapon_mp5sd": "mp5sd",
-            "weapon_mp7": "mp7",
-            "weapon_mp9": "mp9",
-            "weapon_mac10": "mac10",
-            "weapon_ump45": "ump45",
-            "weapon_bizon": "bizon",
-            "weapon_m249": "m249",
-            "weapon_negev": "negev",
-            "weapon_cz75a": "cz75"
-        }
-
-        return weapon_pattern_map.get(self.name)
-
-
-@dataclass
+        return self._pattern_name
+
+
+@dataclass(slots=True)
 class PlayerState:
     """Complete player state from GSI."""
 
@@ -130,7 +191,7 @@ class PlayerState:
     armor: int
     flashing: int
     burning: int
-    weapons: Dict[str, WeaponState]
+    weapons: Tuple[WeaponState, ...]
     active_weapon: Optional[WeaponState]
     timestamp: float
     has_defuse_kit: bool = False
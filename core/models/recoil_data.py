@@ -4,9 +4,9 @@ Recoil compensation data model.
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecoilData:
-    """Represents a single recoil compensation point."""
+    """Represents a single, immutable recoil compensation point."""
 
     dx: float  # Horizontal displacement
     dy: float  # Vertical displacement
@@ -2,21 +2,97 @@
 Weapon profile model with recoil pattern subdivision algorithm.
 """
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
+
+import numpy as np
 
 from core.models.recoil_data import RecoilData
 
 
+# Subdivided patterns keyed by (multiple, raw pattern bytes); reused when a
+# profile is recalculated with inputs already seen (e.g. sensitivity toggles)
+_SUBDIVISION_CACHE: Dict[Tuple[int, bytes], np.ndarray] = {}
+_SUBDIVISION_CACHE_SIZE = 64
+
+# Storage type of subdivided patterns; pixel displacements (|v| < 500) fit
+# well within float32 precision, subdivision itself is computed in float64
+PATTERN_DTYPE = np.float32
+
+
+def _subdivide_kernel(
+        dx: np.ndarray,
+        dy: np.ndarray,
+        multiple: int) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split every (dx, dy) point into `multiple` equal steps.
+
+    Operates on contiguous float64 arrays only, so the whole subdivision is
+    a few array operations with no per-point Python work.
+    """
+    # Calculate precise subdivision values
+    base_dx = dx / multiple
+    base_dy = dy / multiple
+
+    # Track remaining values with the same sequential subtraction as the
+    # scalar algorithm so the last subdivision stays bit-exact
+    remaining_dx = dx.copy()
+    remaining_dy = dy.copy()
+    for _ in range(multiple - 1):
+        remaining_dx -= base_dx
+        remaining_dy -= base_dy
+
+    out_dx = np.repeat(base_dx, multiple)
+    out_dy = np.repeat(base_dy, multiple)
+
+    # Last subdivision gets remaining value for exact precision
+    out_dx[multiple - 1::multiple] = remaining_dx
+    out_dy[multiple - 1::multiple] = remaining_dy
+
+    return out_dx, out_dy
+
+
+def _pattern_arrays(
+        pattern: List[RecoilData],
+        length: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Extract float64 dx, dy and delay arrays from the first `length` points."""
+    # Process only up to specified length
+    pattern_to_process = pattern[:length] if pattern else []
+    n = len(pattern_to_process)
+
+    dx_arr = np.fromiter((p.dx for p in pattern_to_process), dtype=np.float64, count=n)
+    dy_arr = np.fromiter((p.dy for p in pattern_to_process), dtype=np.float64, count=n)
+    delay_arr = np.fromiter((p.delay for p in pattern_to_process), dtype=np.float64, count=n)
+    return dx_arr, dy_arr, delay_arr
+
+
+def _cache_buffer(
+        cache_key: Tuple[int, bytes],
+        out_dx: np.ndarray,
+        out_dy: np.ndarray,
+        out_delay: np.ndarray) -> np.ndarray:
+    """Pack subdivided columns into a read-only buffer and cache it."""
+    buffer = np.column_stack((out_dx, out_dy, out_delay)).astype(PATTERN_DTYPE)
+
+    # Cached buffers are shared between profiles, keep them immutable
+    buffer.flags.writeable = False
+
+    if len(_SUBDIVISION_CACHE) >= _SUBDIVISION_CACHE_SIZE:
+        _SUBDIVISION_CACHE.pop(next(iter(_SUBDIVISION_CACHE)))
+    _SUBDIVISION_CACHE[cache_key] = buffer
+
+    return buffer
+
+
 class PatternSubdivisionAlgorithm:
     """Implements the precise pattern subdivision algorithm."""
 
     @staticmethod
-    def subdivide(
+    def subdivide_buffer(
             pattern: List[RecoilData],
             multiple: int,
-            length: int) -> List[RecoilData]:
+            length: int) -> np.ndarray:
         """
-        Subdivide recoil pattern with exact gap distribution.
+        Subdivide recoil pattern into a contiguous (points, 3) buffer.
 
         Reproduces the original mathematical algorithm:
         - Divide each point by subdivision factor
@@ -29,45 +105,70 @@ class PatternSubdivisionAlgorithm:
             length: Maximum pattern length to process
 
         Returns:
-            Subdivided pattern with exact mathematical precision
+            Read-only array whose rows are (dx, dy, delay)
+        """
+        dx_arr, dy_arr, delay_arr = _pattern_arrays(pattern, length)
+
+        if dx_arr.size == 0 or multiple <= 1:
+            buffer = np.column_stack((dx_arr, dy_arr, delay_arr)).astype(PATTERN_DTYPE)
+            buffer.flags.writeable = False
+            return buffer
+
+        cache_key = (multiple, np.concatenate((dx_arr, dy_arr, delay_arr)).tobytes())
+        cached = _SUBDIVISION_CACHE.get(cache_key)
+        if cached is not None:
+            return cached
+
+        out_dx, out_dy = _subdivide_kernel(dx_arr, dy_arr, multiple)
+        return _cache_buffer(
+            cache_key, out_dx, out_dy, np.repeat(delay_arr, multiple))
+
+    @staticmethod
+    def subdivide_batch(
+            patterns: List[List[RecoilData]],
+            multiple: int,
+            lengths: List[int]) -> None:
+        """
+        Subdivide several patterns sharing one factor in a single kernel call.
+
+        Patterns are concatenated point-wise (the kernel has no cross-point
+        state), subdivided together and split back; each result is stored in
+        the subdivision cache so subsequent subdivide_buffer calls hit it.
+
+        Args:
+            patterns: Original recoil patterns
+            multiple: Subdivision factor shared by all patterns
+            lengths: Maximum pattern length to process, per pattern
         """
-        if not pattern or multiple <= 1:
-            return pattern[:length] if pattern else []
-
-        # Process only up to specified length
-        pattern_to_process = pattern[:length]
-        result = []
-
-        # Process each original point
-        for point in pattern_to_process:
-            # Calculate precise subdivision values
-            base_dx = point.dx / multiple
-            base_dy = point.dy / multiple
-
-            # Track fractional parts for precise distribution
-            remaining_dx = point.dx
-            remaining_dy = point.dy
-
-            # Subdivide current point
-            for j in range(multiple):
-                if j == multiple - 1:
-                    # Last subdivision gets remaining value for exact precision
-                    sub_dx = remaining_dx
-                    sub_dy = remaining_dy
-                else:
-                    # Use precise floating-point division
-                    sub_dx = base_dx
-                    sub_dy = base_dy
-                    remaining_dx -= base_dx
-                    remaining_dy -= base_dy
-
-                result.append(RecoilData(
-                    dx=sub_dx,
-                    dy=sub_dy,
-                    delay=point.delay
-                ))
-
-        return result
+        if multiple <= 1:
+            return
+
+        pending = []
+        for pattern, length in zip(patterns, lengths):
+            dx_arr, dy_arr, delay_arr = _pattern_arrays(pattern, length)
+            if dx_arr.size == 0:
+                continue
+
+            cache_key = (multiple, np.concatenate((dx_arr, dy_arr, delay_arr)).tobytes())
+            if cache_key not in _SUBDIVISION_CACHE:
+                pending.append((cache_key, dx_arr, dy_arr, delay_arr))
+
+        if not pending:
+            return
+
+        out_dx, out_dy = _subdivide_kernel(
+            np.concatenate([item[1] for item in pending]),
+            np.concatenate([item[2] for item in pending]),
+            multiple)
+        out_delay = np.repeat(np.concatenate([item[3] for item in pending]), multiple)
+
+        offsets = np.cumsum([item[1].size * multiple for item in pending])[:-1]
+        for cache_key, dx, dy, delay in zip(
+                [item[0] for item in pending],
+                np.split(out_dx, offsets),
+                np.split(out_dy, offsets),
+                np.split(out_delay, offsets)):
+            _cache_buffer(cache_key, dx, dy, delay)
 
 
 class WeaponProfile:
@@ -100,6 +201,8 @@ class WeaponProfile:
             jitter_timing: Random timing variation (+/- milliseconds)
             jitter_movement: Random movement variation (+/- percentage, 0-100)
         """
+        self._dict_cache: Optional[Dict[str, Any]] = None
+
         self.name = name
         self.display_name = display_name or name
         self.length = length
@@ -110,22 +213,114 @@ class WeaponProfile:
         self.jitter_timing = jitter_timing
         self.jitter_movement = jitter_movement
         self.recoil_pattern = recoil_pattern
-        self.calculated_pattern: List[RecoilData] = []
+
+        # Pattern at sensitivity 1.0 as (points, 3) rows; when set, sensitivity
+        # changes rescale it instead of reloading the CSV
+        self.base_pattern: Optional[np.ndarray] = None
+
+        # Subdivided pattern as one (points, 3) buffer of (dx, dy, delay) rows
+        self.pattern_buffer = np.empty((0, 3), dtype=PATTERN_DTYPE)
 
         self.logger = logging.getLogger(f"Weapon.{name}")
         self._calculate_pattern()
 
         self.logger.debug(
-            f"Weapon '{name}' initialized with {len(self.calculated_pattern)} calculated points")
+            "Weapon '%s' initialized with %d calculated points",
+            name, len(self.pattern_buffer))
+
+    def _invalidate_dict_cache(self) -> None:
+        """Drop the cached serialized form after a configuration change."""
+        self._dict_cache = None
+
+    @property
+    def display_name(self) -> str:
+        """Display name for UI."""
+        return self._display_name
+
+    @display_name.setter
+    def display_name(self, value: str) -> None:
+        self._display_name = value
+        self._invalidate_dict_cache()
+
+    @property
+    def length(self) -> int:
+        """Pattern length (points to use)."""
+        return self._length
+
+    @length.setter
+    def length(self, value: int) -> None:
+        self._length = value
+        self._invalidate_dict_cache()
+
+    @property
+    def multiple(self) -> int:
+        """Subdivision factor for smoothness."""
+        return self._multiple
+
+    @multiple.setter
+    def multiple(self, value: int) -> None:
+        self._multiple = value
+        self._invalidate_dict_cache()
+
+    @property
+    def sleep_divider(self) -> float:
+        """Timing divider."""
+        return self._sleep_divider
+
+    @sleep_divider.setter
+    def sleep_divider(self, value: float) -> None:
+        self._sleep_divider = value
+        self._invalidate_dict_cache()
+
+    @property
+    def sleep_suber(self) -> float:
+        """Timing adjustment."""
+        return self._sleep_suber
+
+    @sleep_suber.setter
+    def sleep_suber(self, value: float) -> None:
+        self._sleep_suber = value
+        self._invalidate_dict_cache()
+
+    @property
+    def jitter_timing(self) -> float:
+        """Random timing variation (+/- milliseconds)."""
+        return self._jitter_timing
+
+    @jitter_timing.setter
+    def jitter_timing(self, value: float) -> None:
+        self._jitter_timing = value
+        self._invalidate_dict_cache()
+
+    @property
+    def jitter_movement(self) -> float:
+        """Random movement variation (+/- percentage, 0-100)."""
+        return self._jitter_movement
+
+    @jitter_movement.setter
+    def jitter_movement(self, value: float) -> None:
+        self._jitter_movement = value
+        self._invalidate_dict_cache()
+
+    @property
+    def calculated_pattern_dx(self) -> np.ndarray:
+        """Horizontal displacement column of the subdivided pattern."""
+        return self.pattern_buffer[:, 0]
+
+    @property
+    def calculated_pattern_dy(self) -> np.ndarray:
+        """Vertical displacement column of the subdivided pattern."""
+        return self.pattern_buffer[:, 1]
+
+    @property
+    def calculated_pattern_delay(self) -> np.ndarray:
+        """Delay column of the subdivided pattern."""
+        return self.pattern_buffer[:, 2]
 
     def _calculate_pattern(self) -> None:
         """Calculate subdivided pattern using precise algorithm."""
-        if not self.recoil_pattern:
-            self.calculated_pattern = []
-            return
-
         # Apply subdivision algorithm
-        self.calculated_pattern = PatternSubdivisionAlgorithm.subdivide(
+        self.pattern_buffer = PatternSubdivisionAlgorithm.subdivide_buffer(
             self.recoil_pattern, self.multiple, self.length
         )
 
@@ -133,16 +328,19 @@ class WeaponProfile:
         self._validate_subdivision_precision()
 
     def _validate_subdivision_precision(self) -> None:
-        """Validate subdivision maintains mathematical precision."""
-        if not self.recoil_pattern or not self.calculated_pattern:
+        """Validate subdivision maintains mathematical precision (debug only)."""
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+
+        if not self.recoil_pattern or not len(self.pattern_buffer):
             return
 
         # Calculate expected vs actual sums
         pattern_to_process = self.recoil_pattern[:self.length]
         expected_sum_x = sum(p.dx for p in pattern_to_process)
         expected_sum_y = sum(p.dy for p in pattern_to_process)
-        actual_sum_x = sum(p.dx for p in self.calculated_pattern)
-        actual_sum_y = sum(p.dy for p in self.calculated_pattern)
+        actual_sum_x = float(self.calculated_pattern_dx.sum(dtype=np.float64))
+        actual_sum_y = float(self.calculated_pattern_dy.sum(dtype=np.float64))
 
         self.logger.debug(
             "Precision validation - X: expected=%.2f, actual=%.2f",
@@ -162,35 +360,51 @@ class WeaponProfile:
 
     def recalculate_pattern(self) -> None:
         """Force recalculation of pattern after parameter changes."""
+        self._invalidate_dict_cache()
         self._calculate_pattern()
         self.logger.info(
-            f"Pattern recalculated: {len(self.calculated_pattern)} points")
+            "Pattern recalculated: %d points", len(self.pattern_buffer))
+
+    @staticmethod
+    def scale_pattern(
+            base_pattern: np.ndarray,
+            sensitivity: float) -> List[RecoilData]:
+        """Apply game sensitivity to a (points, 3) pattern loaded at sensitivity 1.0."""
+        dx = (base_pattern[:, 0] / sensitivity).tolist()
+        dy = (base_pattern[:, 1] / sensitivity).tolist()
+        return list(map(RecoilData, dx, dy, base_pattern[:, 2].tolist()))
 
     def update_sensitivity(
             self,
             new_sensitivity: float,
-            csv_repository) -> bool:
+            csv_repository=None) -> bool:
         """
-        Update sensitivity and reload pattern from CSV.
+        Update sensitivity, rescaling the base pattern or reloading from CSV.
 
         Args:
             new_sensitivity: New game sensitivity
-            csv_repository: Repository to reload CSV data
+            csv_repository: Repository to reload CSV data when no base pattern is cached
 
         Returns:
             True if update successful
         """
         try:
-            csv_file = f"{self.name}.csv"
-            new_recoil_data = csv_repository.load_weapon_pattern(
-                csv_file, new_sensitivity)
+            if self.base_pattern is not None:
+                new_recoil_data = self.scale_pattern(self.base_pattern, new_sensitivity)
+            elif csv_repository is not None:
+                csv_file = f"{self.name}.csv"
+                new_recoil_data = csv_repository.load_weapon_pattern(
+                    csv_file, new_sensitivity)
+            else:
+                new_recoil_data = []
 
             if new_recoil_data:
                 self.recoil_pattern = new_recoil_data
                 self.game_sensitivity = new_sensitivity
+                self._invalidate_dict_cache()
                 self.recalculate_pattern()
 
-                self.logger.info(f"Sensitivity updated: {new_sensitivity}")
+                self.logger.info("Sensitivity updated: %s", new_sensitivity)
                 return True
             else:
                 self.logger.error(
@@ -198,21 +412,28 @@ class WeaponProfile:
                 return False
 
         except Exception as e:
-            self.logger.error(f"Sensitivity update failed: {e}")
+            self.logger.error("Sensitivity update failed: %s", e)
             return False
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert profile to dictionary for serialization."""
-        return {
-            "name": self.name,
-            "display_name": self.display_name,
-            "length": self.length,
-            "multiple": self.multiple,
-            "sleep_divider": self.sleep_divider,
-            "sleep_suber": self.sleep_suber,
-            "jitter_timing": self.jitter_timing,
-            "jitter_movement": self.jitter_movement,
-        }
+        """
+        Convert profile to dictionary for serialization.
+
+        The dictionary is cached until a serialized field changes; callers
+        must treat it as read-only.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = {
+                "name": self.name,
+                "display_name": self.display_name,
+                "length": self.length,
+                "multiple": self.multiple,
+                "sleep_divider": self.sleep_divider,
+                "sleep_suber": self.sleep_suber,
+                "jitter_timing": self.jitter_timing,
+                "jitter_movement": self.jitter_movement,
+            }
+        return self._dict_cache
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any],
@@ -231,9 +452,29 @@ class WeaponProfile:
             jitter_movement=data.get("jitter_movement", 0.0)
         )
 
+    @staticmethod
+    def precompute_subdivisions(profiles_data: List[Dict[str, Any]],
+                                patterns: List[List[RecoilData]]) -> None:
+        """
+        Subdivide the patterns of several profiles in batches.
+
+        Patterns are grouped by subdivision factor and subdivided with one
+        kernel call per group; profiles built afterwards read the results
+        from the subdivision cache.
+        """
+        groups: Dict[int, Tuple[List[List[RecoilData]], List[int]]] = {}
+        for data, pattern in zip(profiles_data, patterns):
+            group = groups.setdefault(data.get("multiple", 6), ([], []))
+            group[0].append(pattern)
+            group[1].append(data.get("length", 30))
+
+        for multiple, (group_patterns, lengths) in groups.items():
+            PatternSubdivisionAlgorithm.subdivide_batch(
+                group_patterns, multiple, lengths)
+
     def __repr__(self) -> str:
         """String representation for debugging."""
         return (f"WeaponProfile(name='{self.name}', "
-                f"points={len(self.calculated_pattern)}, "
+                f"points={len(self.pattern_buffer)}, "
                 f"multiple={self.multiple}, "
                 f"sensitivity={self.game_sensitivity})")
\ No newline at end of file
@@ -1,19 +1,25 @@
 """
 Services package for business logic and application services.
+
+Service classes are resolved lazily (PEP 562) so importing one service
+module does not pull in every other service and its platform dependencies.
 """
+import importlib
 
-from .auto_accept_service import AutoAcceptService
-from .bomb_timer_service import BombTimerService
-from .config_service import ConfigService
-from .console_log_service import ConsoleLogMonitorService
-from .gsi_service import GSIService
-from .hotkey_service import HotkeyService
-from .input_service import InputService
-from .recoil_service import RecoilService
-from .screen_capture_service import ScreenCaptureService
-from .timing_service import TimingService
-from .tts_service import TTSService
-from .weapon_detection_service import WeaponDetectionService
+_LAZY_SERVICES = {
+    'AutoAcceptService': 'auto_accept_service',
+    'BombTimerService': 'bomb_timer_service',
+    'ConfigService': 'config_service',
+    'ConsoleLogMonitorService': 'console_log_service',
+    'GSIService': 'gsi_service',
+    'HotkeyService': 'hotkey_service',
+    'InputService': 'input_service',
+    'RecoilService': 'recoil_service',
+    'ScreenCaptureService': 'screen_capture_service',
+    'TimingService': 'timing_service',
+    'TTSService': 'tts_service',
+    'WeaponDetectionService': 'weapon_detection_service'
+}
 
 __all__ = [
     'AutoAcceptService',
@@ -29,3 +35,20 @@ __all__ = [
     'TTSService',
     'WeaponDetectionService'
 ]
+
+
+def __getattr__(name):
+    """Import the service module on first access and cache the class."""
+    module_name = _LAZY_SERVICES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(f".{module_name}", __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    """Expose lazily resolved services to dir() and autocompletion."""
+    return sorted(set(globals()) | set(__all__))
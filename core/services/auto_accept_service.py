@@ -1,19 +1,29 @@
 """
 Auto Accept Service for automatically accepting CS2 matches.
 """
+import ctypes
 import logging
 import time
 import threading
+from ctypes import wintypes
 from typing import Optional
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Signal, SIGNAL
 import win32api
-import win32con
 import win32gui
+import win32process
 
 from core.services.console_log_service import ConsoleLogMonitorService
 from core.services.screen_capture_service import ScreenCaptureService
 
 
+CREATE_WAITABLE_TIMER_HIGH_RESOLUTION = 0x00000002
+TIMER_ALL_ACCESS = 0x1F0003
+
+# Win32 entry points bound once instead of resolved on every call
+_GetCursorPos = win32gui.GetCursorPos
+_GetForegroundWindow = win32gui.GetForegroundWindow
+
+
 class AutoAcceptService(QObject):
     """Service for automatically accepting CS2 matches when found."""
 
@@ -34,13 +44,42 @@ class AutoAcceptService(QObject):
 
         self.gsi_service = None
 
+        # Cached "auto_accept_enabled" feature flag, refreshed on config revision change
+        self._features_cache = False
+        self._features_rev = -1
+
         self.enabled = False
         self.accepting_in_progress = False
         self.accept_thread: Optional[threading.Thread] = None
+        self._worker_running = False
+        self._accept_trigger = threading.Event()
+
+        # Repeated match-found lines within this window are coalesced
+        self.trigger_debounce = 2.0
+        self._last_trigger = 0.0
 
         self.waiting_time = 5  # Default waiting time in seconds
         self.target_color = (54, 183, 82)  # Green Accept button color
         self.color_tolerance = 20
+        # Share of sampled pixels that must match; the button label and its
+        # anti-aliased edges cover part of the sampled region
+        self.match_ratio_threshold = 0.25
+        self.poll_interval_ms = 20
+
+        # Periodic waitable timer pacing the Accept button detection loop
+        self._kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+        self._kernel32.CreateWaitableTimerExW.restype = wintypes.HANDLE
+        self._kernel32.CreateWaitableTimerExW.argtypes = [
+            wintypes.LPVOID, wintypes.LPCWSTR, wintypes.DWORD, wintypes.DWORD]
+        self._kernel32.SetWaitableTimer.argtypes = [
+            wintypes.HANDLE, ctypes.POINTER(wintypes.LARGE_INTEGER), wintypes.LONG,
+            wintypes.LPVOID, wintypes.LPVOID, wintypes.BOOL]
+        self._kernel32.CancelWaitableTimer.argtypes = [wintypes.HANDLE]
+        self._kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+        self._kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+        # Owned by the worker thread: created when it starts, closed when it exits
+        self._poll_timer: Optional[int] = None
+        self._poll_timer_armed = False
 
         self.match_found_signal.connect(self._on_match_found_signal)
 
@@ -49,18 +88,69 @@ class AutoAcceptService(QObject):
 
         self.logger.info("Auto Accept Service initialized")
 
+    def _emit_status(self, message: str):
+        """Emit a status update only when something is connected to it."""
+        if self.receivers(SIGNAL("status_update_signal(QString)")) > 0:
+            self.status_update_signal.emit(message)
+
     def should_be_enabled(self) -> bool:
         """Check if Auto Accept should be enabled based on features configuration."""
         try:
             if not self.config_service:
                 return False
 
-            features = self.config_service.config.get("features", {})
-            return features.get("auto_accept_enabled", False)
+            rev = self.config_service.revision
+            if rev != self._features_rev:
+                features = self.config_service.config.get("features", {})
+                self._features_cache = features.get("auto_accept_enabled", False)
+                self._features_rev = rev
+
+            return self._features_cache
         except Exception as e:
             self.logger.error(f"Error checking Auto Accept enabled state: {e}")
             return False
 
+    def _create_poll_timer(self) -> Optional[int]:
+        """Create the detection loop timer, high resolution when supported."""
+        for flags in (CREATE_WAITABLE_TIMER_HIGH_RESOLUTION, 0):
+            handle = self._kernel32.CreateWaitableTimerExW(None, None, flags, TIMER_ALL_ACCESS)
+            if handle:
+                return handle
+
+        self.logger.warning(f"Waitable timer unavailable, falling back to sleep: {ctypes.get_last_error()}")
+        return None
+
+    def _close_poll_timer(self) -> None:
+        """Release the detection loop timer handle."""
+        if self._poll_timer:
+            self._kernel32.CloseHandle(self._poll_timer)
+            self._poll_timer = None
+            self._poll_timer_armed = False
+
+    def _start_poll_timer(self) -> None:
+        """Arm the detection loop timer with a relative due time and fixed period."""
+        if self._poll_timer:
+            due_time = wintypes.LARGE_INTEGER(-self.poll_interval_ms * 10000)  # 100 ns units
+            self._poll_timer_armed = bool(self._kernel32.SetWaitableTimer(
+                self._poll_timer, ctypes.byref(due_time), self.poll_interval_ms, None, None, False))
+            if not self._poll_timer_armed:
+                self.logger.warning("Could not arm waitable timer, falling back to sleep: %d",
+                                    ctypes.get_last_error())
+
+    def _wait_poll_interval(self) -> None:
+        """Block until the next detection tick."""
+        if self._poll_timer_armed:
+            # Bounded wait so a timer that stops signalling cannot hang the worker
+            self._kernel32.WaitForSingleObject(self._poll_timer, self.poll_interval_ms * 2)
+        else:
+            time.sleep(self.poll_interval_ms / 1000.0)
+
+    def _cancel_poll_timer(self) -> None:
+        """Stop the detection loop timer."""
+        if self._poll_timer_armed:
+            self._kernel32.CancelWaitableTimer(self._poll_timer)
+            self._poll_timer_armed = False
+
     def set_gsi_service(self, gsi_service):
         """Set GSI service reference and update console monitor."""
         self.gsi_service = gsi_service
@@ -103,7 +193,8 @@ class AutoAcceptService(QObject):
                 return False
 
             self.enabled = True
-            self.status_update_signal.emit("Auto Accept enabled")
+            self._start_worker()
+            self._emit_status("Auto Accept enabled")
 
 
             self.logger.debug("Auto Accept service enabled")
@@ -124,11 +215,13 @@ class AutoAcceptService(QObject):
             # Stop console log monitoring
             self.console_monitor.stop_monitoring()
 
-            # Wait for any ongoing accept process to finish
+            # Stop the worker, waiting for any ongoing accept process to finish
+            self._worker_running = False
+            self._accept_trigger.set()
             if self.accept_thread and self.accept_thread.is_alive():
                 self.accept_thread.join(timeout=2.0)
 
-            self.status_update_signal.emit("Auto Accept disabled")
+            self._emit_status("Auto Accept disabled")
 
 
             self.logger.debug("Auto Accept service disabled")
@@ -143,7 +236,12 @@ class AutoAcceptService(QObject):
         if not self.enabled:
             return
 
-        self.logger.info(f"Match found in console: {line}")
+        now = time.monotonic()
+        if now - self._last_trigger < self.trigger_debounce:
+            return
+        self._last_trigger = now
+
+        self.logger.info("Match found in console: %s", line)
         self.match_found_signal.emit()
 
     def _on_match_found_signal(self):
@@ -153,19 +251,62 @@ class AutoAcceptService(QObject):
 
         self.accepting_in_progress = True
 
-        # Start accept process in separate thread
+        # Wake the persistent worker to run the accept process
+        self._accept_trigger.set()
+
+    def _start_worker(self):
+        """Start the persistent accept worker thread if not already running."""
+        if self.accept_thread and self.accept_thread.is_alive():
+            # Drop a shutdown wake the old worker has not consumed yet
+            self._accept_trigger.clear()
+            self._worker_running = True
+            return
+
+        self._worker_running = True
+        self._accept_trigger.clear()
         self.accept_thread = threading.Thread(
-            target=self._accept_match_process,
+            target=self._worker_loop,
             daemon=True,
             name="AutoAcceptProcess"
         )
         self.accept_thread.start()
 
+    def _worker_loop(self):
+        """Wait for match found triggers and run the accept process."""
+        self._poll_timer = self._create_poll_timer()
+        try:
+            while True:
+                self._accept_trigger.wait()
+                self._accept_trigger.clear()
+
+                if not self._worker_running:
+                    break
+
+                # Only a match found signal marks an accept as requested
+                if not self.accepting_in_progress:
+                    continue
+
+                # Time-critical only while accepting; idle waits stay at normal priority
+                self._set_worker_priority(win32process.THREAD_PRIORITY_ABOVE_NORMAL)
+                try:
+                    self._accept_match_process()
+                finally:
+                    self._set_worker_priority(win32process.THREAD_PRIORITY_NORMAL)
+        finally:
+            self._close_poll_timer()
+
+    def _set_worker_priority(self, priority: int):
+        """Set scheduling priority of the calling worker thread."""
+        try:
+            win32process.SetThreadPriority(win32api.GetCurrentThread(), priority)
+        except Exception as e:
+            self.logger.debug("Could not set worker thread priority: %s", e)
+
     def _accept_match_process(self):
         """Main process for accepting a match."""
         try:
             self.logger.debug("Starting Auto Accept process")
-            self.status_update_signal.emit("Match found! Starting Auto Accept...")
+            self._emit_status("Match found! Starting Auto Accept...")
 
             if self.tts_service:
                 self.tts_service.speak("Match found")
@@ -177,13 +318,13 @@ class AutoAcceptService(QObject):
             window_info = self.screen_capture.get_window_info()
             if not window_info:
                 self.logger.error("CS2 window not found")
-                self.status_update_signal.emit("Error: CS2 window not found")
+                self._emit_status("Error: CS2 window not found")
                 return
 
             # Ensure CS2 window is brought to foreground with verification
             if not self._ensure_window_foreground():
                 self.logger.warning("Failed to bring CS2 window to foreground, but continuing...")
-                self.status_update_signal.emit("Warning: CS2 may not be in foreground, but trying to accept...")
+                self._emit_status("Warning: CS2 may not be in foreground, but trying to accept...")
                 # Don't return - continue with the process
 
             # Additional wait to ensure window is fully active
@@ -191,54 +332,52 @@ class AutoAcceptService(QObject):
 
             # Calculate Accept button position
             button_x, button_y = self.screen_capture.calculate_accept_button_position(window_info)
-            self.logger.debug(f"Accept button position calculated: ({button_x}, {button_y}) for window {window_info}")
+            self.logger.debug("Accept button position calculated: (%d, %d) for window %s",
+                              button_x, button_y, window_info)
 
             # Monitor for Accept button and click when found
             accept_clicked = False
             start_time = time.time()
+            self._start_poll_timer()
 
             while time.time() - start_time < self.waiting_time:
                 if not self.enabled:
                     self.logger.info("Auto Accept disabled during process")
                     break
 
-                # Check if Accept button is visible (green color)
-                current_color = self.screen_capture.get_pixel_color(button_x, button_y)
-                if current_color:
-                    self.logger.debug(f"Pixel color at ({button_x}, {button_y}): {current_color}")
+                # Check if Accept button is visible (green color), one region grab per poll
+                match_ratio = self.screen_capture.accept_button_match_ratio(
+                    button_x, button_y, self.target_color, self.color_tolerance)
 
-                if self.screen_capture.verify_accept_button_color(window_info, self.target_color, self.color_tolerance):
-                    self.logger.info(f"Accept button detected at ({button_x}, {button_y}), clicking...")
+                if match_ratio is not None and match_ratio >= self.match_ratio_threshold:
+                    self.logger.info("Accept button detected at (%d, %d), clicking...", button_x, button_y)
 
                     # Move mouse to Accept button and click
-                    self._click_at_position(button_x, button_y)
+                    self._click_at_position(button_x, button_y, current_pos)
 
                     accept_clicked = True
                     self.match_accepted_signal.emit()
-                    self.status_update_signal.emit("Match accepted successfully!")
+                    self._emit_status("Match accepted successfully!")
 
 
                     self.logger.info("Match accepted successfully")
                     break
 
-                # Small delay before next check
-                time.sleep(0.1)
-
-            # Restore mouse position
-            if current_pos:
-                win32api.SetCursorPos(current_pos)
+                # Wait for the next detection tick
+                self._wait_poll_interval()
 
             if not accept_clicked:
                 self.logger.warning("Accept button not found within timeout")
-                self.status_update_signal.emit("Timeout: Accept button not found")
+                self._emit_status("Timeout: Accept button not found")
 
 
 
         except Exception as e:
             self.logger.error(f"Error in Auto Accept process: {e}")
-            self.status_update_signal.emit(f"Error: {e}")
+            self._emit_status(f"Error: {e}")
 
         finally:
+            self._cancel_poll_timer()
             self.accepting_in_progress = False
 
     def _ensure_window_foreground(self, max_attempts: int = 3) -> bool:
@@ -252,32 +391,29 @@ class AutoAcceptService(QObject):
             True if window is successfully brought to foreground
         """
         try:
+            hwnd = self.screen_capture.get_hwnd()
+            if not hwnd:
+                self.logger.error("CS2 window not found")
+                return False
+
             # Check if CS2 is already in foreground
-            if self.screen_capture.is_window_foreground():
+            if _GetForegroundWindow() == hwnd:
                 self.logger.debug("CS2 window is already in foreground")
                 return True
 
             self.logger.debug("CS2 window not in foreground, attempting to bring to front")
 
             for attempt in range(max_attempts):
-                self.logger.debug(f"Foreground attempt {attempt + 1}/{max_attempts}")
-
-                # Attempt to bring window to foreground
-                if self.screen_capture.bring_window_to_front():
-                    # Wait a moment for the window to become active
-                    time.sleep(0.2)
-
-                    # Verify the window is now in foreground
-                    if self.screen_capture.is_window_foreground():
-                        self.logger.debug("CS2 window successfully brought to foreground")
-                        return True
-                    else:
-                        self.logger.warning(f"Attempt {attempt + 1}: Window activation failed, retrying...")
-                        # Wait a bit longer before retry
-                        time.sleep(0.3)
-                else:
-                    self.logger.warning(f"Attempt {attempt + 1}: Failed to call bring_window_to_front")
-                    time.sleep(0.3)
+                self.logger.debug("Foreground attempt %d/%d", attempt + 1, max_attempts)
+
+                # bring_window_to_front already waits for the restore to settle
+                self.screen_capture.bring_window_to_front()
+                if _GetForegroundWindow() == hwnd:
+                    self.logger.debug("CS2 window successfully brought to foreground")
+                    return True
+
+                self.logger.warning("Attempt %d: Window activation failed, retrying...", attempt + 1)
+                time.sleep(0.1)
 
             self.logger.error("Failed to bring CS2 window to foreground after all attempts")
             return False
@@ -289,33 +425,17 @@ class AutoAcceptService(QObject):
     def _get_cursor_position(self) -> Optional[tuple]:
         """Get current cursor position."""
         try:
-            x, y = win32gui.GetCursorPos()
+            x, y = _GetCursorPos()
             return (x, y)
         except Exception as e:
             self.logger.error(f"Error getting cursor position: {e}")
             return None
 
-    def _move_cursor_to(self, x: int, y: int):
-        """Move cursor to absolute position."""
+    def _click_at_position(self, x: int, y: int, restore_pos: Optional[tuple] = None):
+        """Click at specific position, then move back to restore_pos if given."""
         try:
-            win32api.SetCursorPos((x, y))
-        except Exception as e:
-            self.logger.error(f"Error moving cursor to ({x}, {y}): {e}")
-
-    def _click_at_position(self, x: int, y: int):
-        """Click at specific position."""
-        try:
-            # Move cursor to position
-            self._move_cursor_to(x, y)
-            time.sleep(0.01)  # Small delay
-
-            # Use win32api for mouse click - coordinates should be 0,0 for mouse_event
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTDOWN, 0, 0, 0, 0)
-            time.sleep(0.05)  # Hold click briefly
-            win32api.mouse_event(win32con.MOUSEEVENTF_LEFTUP, 0, 0, 0, 0)
-
-            self.logger.debug(f"Clicked at position ({x}, {y})")
-
+            # Move and click go in one SendInput batch; the restore follows after a short delay
+            self.input_service.mouse_click_at(x, y, restore_pos)
         except Exception as e:
             self.logger.error(f"Error clicking at position ({x}, {y}): {e}")
 
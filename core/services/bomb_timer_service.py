@@ -14,7 +14,7 @@ class BombTimerService(QObject):
     # Qt signals for thread-safe communication
     bomb_planted_signal = Signal()
     bomb_defused_signal = Signal()
-    timer_update_signal = Signal(float, bool, bool)  # remaining_time, has_kit, can_defuse
+    timer_update_signal = Signal(float, bool, bool)  # remaining_time, has_kit, can_defuse (final update only)
 
     def __init__(self, config_service=None):
         super().__init__()
@@ -30,15 +30,30 @@ class BombTimerService(QObject):
         self.DEFUSE_TIME_WITH_KIT = 5.0
         self.DEFUSE_TIME_WITHOUT_KIT = 10.0
 
+        # Cached "bomb_timer_enabled" feature flag, refreshed on config revision change
+        self._features_cache = True
+        self._features_rev = -1
+
         self.has_defuse_kit = False
+        # Derived from plant time and kit state, monotonic clock nanoseconds
+        self._explode_ns = 0
+        self._defuse_time_needed = self.DEFUSE_TIME_WITHOUT_KIT
+        self._can_defuse_deadline_ns = 0
         self.current_player_state: Optional[PlayerState] = None
 
         self.timer_update_callback: Optional[Callable[[float, bool, bool], None]] = None
         self.defuse_alert_callback: Optional[Callable[[bool], None]] = None
 
+        # UI refresh ticks, only run while a timer update callback is attached
+        self.UI_UPDATE_INTERVAL_MS = 100
         self.qt_timer = QTimer(self)
         self.qt_timer.timeout.connect(self._timer_update)
 
+        # Single deadline for the explosion, independent of UI refresh
+        self.explode_timer = QTimer(self)
+        self.explode_timer.setSingleShot(True)
+        self.explode_timer.timeout.connect(self._on_bomb_exploded)
+
         self.bomb_planted_signal.connect(self._start_bomb_timer)
         self.bomb_defused_signal.connect(self._stop_bomb_timer)
         self.timer_update_signal.connect(self._emit_callback)
@@ -50,14 +65,17 @@ class BombTimerService(QObject):
         if not self.config_service:
             return True  # Default to enabled if no config service
 
-        features = self.config_service.config.get("features", {})
-        enabled = features.get("bomb_timer_enabled", True)
+        rev = self.config_service.revision
+        if rev != self._features_rev:
+            features = self.config_service.config.get("features", {})
+            self._features_cache = features.get("bomb_timer_enabled", True)
+            self._features_rev = rev
 
-        # If feature was disabled while timer was active, stop it
-        if not enabled and self.bomb_timer_active:
-            self._stop_bomb_timer(defused=True)
+            # If feature was disabled while timer was active, stop it
+            if not self._features_cache and self.bomb_timer_active:
+                self._stop_bomb_timer(defused=True)
 
-        return enabled
+        return self._features_cache
 
     def process_player_state(self, player_state: PlayerState) -> None:
         """Process player state updates from GSI - can be called from any thread."""
@@ -66,7 +84,9 @@ class BombTimerService(QObject):
                 return
 
             self.current_player_state = player_state
-            self.has_defuse_kit = player_state.has_defuse_kit
+            if player_state.has_defuse_kit != self.has_defuse_kit:
+                self.has_defuse_kit = player_state.has_defuse_kit
+                self._update_defuse_deadline()
 
             # Start timer when bomb is planted
             if player_state.bomb_planted and not self.bomb_timer_active:
@@ -83,13 +103,18 @@ class BombTimerService(QObject):
         if self.bomb_timer_active:
             return
 
-        self.bomb_planted_time = time.time()
+        planted_ns = time.monotonic_ns()
+        self.bomb_planted_time = planted_ns / 1e9
+        self._explode_ns = planted_ns + int(self.BOMB_TIMER_DURATION * 1_000_000_000)
+        self._update_defuse_deadline()
         self.bomb_timer_active = True
         self.bomb_defused = False
         self.bomb_exploded = False
 
-        # Start Qt timer (50ms intervals for smooth animation)
-        self.qt_timer.start(50)
+        # Explosion is a single scheduled deadline; UI ticks only when observed
+        self.explode_timer.start(int(self.BOMB_TIMER_DURATION * 1000))
+        if self.timer_update_callback is not None:
+            self.qt_timer.start(self.UI_UPDATE_INTERVAL_MS)
 
         self.logger.info("Bomb timer started")
 
@@ -99,6 +124,7 @@ class BombTimerService(QObject):
             return
 
         self.qt_timer.stop()
+        self.explode_timer.stop()
         self.bomb_timer_active = False
         self.bomb_defused = defused
         self.bomb_exploded = not defused
@@ -109,28 +135,36 @@ class BombTimerService(QObject):
         status = "defused" if defused else "exploded"
         self.logger.info(f"Bomb timer {status}")
 
+    def _update_defuse_deadline(self) -> None:
+        """Recompute defuse time and the last moment a defuse can still finish."""
+        self._defuse_time_needed = (self.DEFUSE_TIME_WITH_KIT if self.has_defuse_kit
+                                    else self.DEFUSE_TIME_WITHOUT_KIT)
+        self._can_defuse_deadline_ns = self._explode_ns - int(self._defuse_time_needed * 1_000_000_000)
+
+    def _on_bomb_exploded(self) -> None:
+        """Explosion deadline reached - called in main thread by the single-shot timer."""
+        self._stop_bomb_timer(defused=False)
+
     def _timer_update(self) -> None:
-        """Qt Timer update - called every 50ms in main thread."""
+        """Qt Timer update - called every UI_UPDATE_INTERVAL_MS in main thread."""
         try:
             if not self.bomb_timer_active or self.bomb_planted_time is None:
                 return
 
-            current_time = time.time()
-            elapsed_time = current_time - self.bomb_planted_time
-            remaining_time = max(0.0, self.BOMB_TIMER_DURATION - elapsed_time)
-
-            # Check if bomb should explode
-            if remaining_time <= 0.0:
+            now_ns = time.monotonic_ns()
+            remaining_ns = self._explode_ns - now_ns
+            if remaining_ns <= 0:
+                # Tick landed before the single-shot deadline was delivered
                 self._stop_bomb_timer(defused=False)
                 return
 
-            # Check defuse possibility
-            defuse_time_needed = (self.DEFUSE_TIME_WITH_KIT if self.has_defuse_kit
-                                else self.DEFUSE_TIME_WITHOUT_KIT)
-            can_defuse = remaining_time >= defuse_time_needed
+            remaining_time = remaining_ns * 1e-9
+            can_defuse = now_ns <= self._can_defuse_deadline_ns
 
-            # Emit signal for callback (thread-safe)
-            self.timer_update_signal.emit(remaining_time, self.has_defuse_kit, can_defuse)
+            # Timer ticks run in the main thread, call the consumer directly
+            callback = self.timer_update_callback
+            if callback:
+                callback(remaining_time, self.has_defuse_kit, can_defuse)
 
         except Exception as e:
             self.logger.error(f"Qt Timer update error: {e}")
@@ -145,29 +179,30 @@ class BombTimerService(QObject):
         if not self.bomb_timer_active or self.bomb_planted_time is None:
             return 0.0
 
-        current_time = time.time()
-        elapsed_time = current_time - self.bomb_planted_time
-        return max(0.0, self.BOMB_TIMER_DURATION - elapsed_time)
+        return max(0, self._explode_ns - time.monotonic_ns()) * 1e-9
 
     def can_defuse(self) -> bool:
         """Check if player can defuse the bomb in time."""
         if not self.bomb_timer_active:
             return False
 
-        remaining_time = self.get_remaining_time()
-        defuse_time_needed = (self.DEFUSE_TIME_WITH_KIT if self.has_defuse_kit
-                            else self.DEFUSE_TIME_WITHOUT_KIT)
-
-        return remaining_time >= defuse_time_needed
+        return time.monotonic_ns() <= self._can_defuse_deadline_ns
 
     def get_defuse_time_needed(self) -> float:
         """Get time needed to defuse based on kit availability."""
-        return (self.DEFUSE_TIME_WITH_KIT if self.has_defuse_kit
-                else self.DEFUSE_TIME_WITHOUT_KIT)
+        return self._defuse_time_needed
 
-    def set_timer_update_callback(self, callback: Callable[[float, bool, bool], None]) -> None:
+    def set_timer_update_callback(self, callback: Optional[Callable[[float, bool, bool], None]]) -> None:
         """Set callback for timer updates. Args: (remaining_time, has_kit, can_defuse)"""
         self.timer_update_callback = callback
+
+        # UI ticks only run while a consumer is attached; the explosion
+        # deadline is tracked separately by explode_timer
+        if callback is None:
+            self.qt_timer.stop()
+        elif self.bomb_timer_active and not self.qt_timer.isActive():
+            self.qt_timer.start(self.UI_UPDATE_INTERVAL_MS)
+
         self.logger.debug("Timer update callback registered")
 
     def set_defuse_alert_callback(self, callback: Callable[[bool], None]) -> None:
@@ -183,6 +218,7 @@ class BombTimerService(QObject):
         if self.bomb_timer_active:
             self._stop_bomb_timer()
         self.qt_timer.stop()
+        self.explode_timer.stop()
         self.logger.debug("Bomb timer service stopped")
 
     def check_config_and_update(self) -> None:
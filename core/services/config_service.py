@@ -2,11 +2,25 @@
 Centralized configuration management service.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import Dict, List, Any, Optional
 
+import numpy as np
+
+from core.models.recoil_data import RecoilData
 from core.models.weapon import WeaponProfile
 from data.config_repository import ConfigRepository, CSVRepository
 
+# Applied to any feature flag missing from the configuration
+_DEFAULT_FEATURES = MappingProxyType({
+    "tts_enabled": True,
+    "bomb_timer_enabled": False,
+    "follow_rcs_enabled": True
+})
+
+_BOOL_FEATURES = ("tts_enabled", "bomb_timer_enabled")
+
 
 class ConfigurationValidator:
     """Validates configuration data integrity."""
@@ -16,38 +30,26 @@ class ConfigurationValidator:
         """Validate sensitivity is within acceptable range."""
         return 0.1 <= value <= 10.0
 
+    # (field, accepted types, range check) for required weapon fields
+    WEAPON_SCHEMA = (
+        ('name', str, lambda value: bool(value.strip())),
+        ('length', int, lambda value: value > 0),
+        ('multiple', int, lambda value: value > 0),
+        ('sleep_divider', (int, float), lambda value: value > 0),
+    )
+
     @staticmethod
     def validate_weapon_data(weapon_data: Dict[str, Any]) -> bool:
         """Validate weapon configuration data."""
-        required_fields = ['name', 'length', 'multiple', 'sleep_divider']
-
         try:
-            # Check required fields exist
-            for field in required_fields:
-                if field not in weapon_data:
+            for field, types, check in ConfigurationValidator.WEAPON_SCHEMA:
+                value = weapon_data.get(field)
+                if not isinstance(value, types) or not check(value):
                     return False
 
-            # Validate data types and ranges
-            name = weapon_data['name']
-            if not isinstance(name, str) or not name.strip():
-                return False
-
-            length = weapon_data['length']
-            if not isinstance(length, int) or length <= 0:
-                return False
-
-            multiple = weapon_data['multiple']
-            if not isinstance(multiple, int) or multiple <= 0:
-                return False
-
-            sleep_divider = weapon_data['sleep_divider']
-            if not isinstance(sleep_divider, (int, float)
-                              ) or sleep_divider <= 0:
-                return False
-
             return True
 
-        except (KeyError, TypeError):
+        except (AttributeError, TypeError):
             return False
 
     @staticmethod
@@ -57,8 +59,7 @@ class ConfigurationValidator:
         try:
 
             # Validate boolean features
-            bool_features = ["tts_enabled", "bomb_timer_enabled"]
-            for feature in bool_features:
+            for feature in _BOOL_FEATURES:
                 if feature in features_data:
                     if not isinstance(features_data[feature], bool):
                         return False
@@ -84,48 +85,70 @@ class WeaponManager:
                                                               WeaponProfile]:
         """Load all weapon profiles from configuration."""
         profiles = {}
+        profiles_data: List[Dict[str, Any]] = []
+        patterns: List[List[RecoilData]] = []
+        base_patterns: List[np.ndarray] = []
 
+        # Validate up front so only usable weapons reach the loader pool
+        valid_configs = []
         for weapon_config in weapons_config:
+            if ConfigurationValidator.validate_weapon_data(weapon_config):
+                valid_configs.append(weapon_config)
+            else:
+                name = weapon_config.get('name', 'unknown') \
+                    if isinstance(weapon_config, dict) else 'unknown'
+                self.logger.warning(f"Invalid weapon configuration: {name}")
+
+        # Pattern files are independent, so read them concurrently; map keeps
+        # results in configuration order
+        base_results = []
+        if valid_configs:
+            with ThreadPoolExecutor(
+                    max_workers=min(8, len(valid_configs)),
+                    thread_name_prefix="PatternLoader") as executor:
+                base_results = list(executor.map(
+                    self._load_base_pattern, valid_configs))
+
+        for weapon_config, base_data in zip(valid_configs, base_results):
             try:
-                if not ConfigurationValidator.validate_weapon_data(
-                        weapon_config):
-                    self.logger.warning(
-                        f"Invalid weapon configuration: {weapon_config.get('name', 'unknown')}")
-                    continue
-
                 name = weapon_config["name"]
-                csv_file = f"{name}.csv"
-
-                # Load recoil data with sensitivity applied
-                recoil_data = self.csv_repository.load_weapon_pattern(
-                    csv_file, game_sensitivity)
-                if not recoil_data:
+                if not base_data:
                     self.logger.warning(
                         f"Pattern not found for weapon: {name}")
                     continue
 
-                # Create weapon profile
-                profile = WeaponProfile(
-                    name=name,
-                    display_name=weapon_config.get("display_name", name),
-                    recoil_pattern=recoil_data,
-                    length=weapon_config.get("length", 30),
-                    multiple=weapon_config.get("multiple", 6),
-                    sleep_divider=weapon_config.get("sleep_divider", 6.0),
-                    sleep_suber=weapon_config.get("sleep_suber", 0.0),
-                    jitter_timing=weapon_config.get("jitter_timing", 0.0),
-                    jitter_movement=weapon_config.get("jitter_movement", 0.0),
-                    game_sensitivity=game_sensitivity
-                )
-
-                profiles[name] = profile
-                self.logger.debug(f"Loaded weapon profile: {name}")
+                base_pattern = np.array(
+                    [(p.dx, p.dy, p.delay) for p in base_data], dtype=np.float64)
+                recoil_data = WeaponProfile.scale_pattern(base_pattern, game_sensitivity)
+
+                profiles_data.append(
+                    {**weapon_config, "game_sensitivity": game_sensitivity})
+                patterns.append(recoil_data)
+                base_patterns.append(base_pattern)
 
             except Exception as e:
                 self.logger.error(
                     f"Failed to load weapon {weapon_config.get('name', 'unknown')}: {e}")
                 continue
 
+        # Subdivide all patterns in batches up front; a failure here only
+        # costs speed, each profile subdivides its own pattern on a cache miss
+        try:
+            WeaponProfile.precompute_subdivisions(profiles_data, patterns)
+        except Exception as e:
+            self.logger.warning(f"Batched pattern subdivision failed: {e}")
+
+        for profile_data, recoil_data, base_pattern in zip(
+                profiles_data, patterns, base_patterns):
+            try:
+                profile = WeaponProfile.from_dict(profile_data, recoil_data)
+                profile.base_pattern = base_pattern
+                profiles[profile.name] = profile
+                self.logger.debug(f"Loaded weapon profile: {profile.name}")
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to load weapon {profile_data.get('name', 'unknown')}: {e}")
+
         self.profiles = profiles
         if profiles:
             weapon_names = ", ".join(sorted(profiles.keys()))
@@ -134,30 +157,42 @@ class WeaponManager:
             self.logger.warning("No weapon profiles loaded")
         return profiles
 
+    def _load_base_pattern(self, weapon_config: Dict[str, Any]) -> List[RecoilData]:
+        """Load the unscaled pattern for a weapon; sensitivity is applied in memory."""
+        try:
+            return self.csv_repository.load_weapon_pattern(
+                f"{weapon_config['name']}.csv", 1.0)
+        except Exception as e:
+            self.logger.error(
+                f"Failed to load weapon {weapon_config.get('name', 'unknown')}: {e}")
+            return []
+
     def update_weapon_sensitivity(
             self,
             weapon_name: str,
             new_sensitivity: float) -> bool:
         """Update sensitivity for specific weapon."""
-        if weapon_name not in self.profiles:
-            raise KeyError(f"Weapon not found: {weapon_name}")
+        try:
+            profile = self.profiles[weapon_name]
+        except KeyError:
+            raise KeyError(f"Weapon not found: {weapon_name}") from None
 
         if not ConfigurationValidator.validate_sensitivity(new_sensitivity):
             raise ValueError(f"Invalid sensitivity value: {new_sensitivity}")
 
-        return self.profiles[weapon_name].update_sensitivity(
-            new_sensitivity, self.csv_repository)
+        return profile.update_sensitivity(new_sensitivity, self.csv_repository)
 
     def update_all_weapons_sensitivity(self, new_sensitivity: float) -> int:
         """Update sensitivity for all weapons. Returns count of successful updates."""
         if not ConfigurationValidator.validate_sensitivity(new_sensitivity):
             raise ValueError(f"Invalid sensitivity value: {new_sensitivity}")
 
+        # Sensitivity is validated once above rather than per weapon
         success_count = 0
-        for weapon_name in self.profiles.keys():
+        for weapon_name, profile in self.profiles.items():
             try:
-                if self.update_weapon_sensitivity(
-                        weapon_name, new_sensitivity):
+                if profile.update_sensitivity(
+                        new_sensitivity, self.csv_repository):
                     success_count += 1
             except Exception as e:
                 self.logger.warning(
@@ -181,6 +216,11 @@ class ConfigService:
         self.config = {}
         self.weapon_profiles: Dict[str, WeaponProfile] = {}
         self.hotkeys = {}
+        self._display_name_index: Dict[str, str] = {}
+
+        # Bumped whenever the configuration is loaded or saved so consumers
+        # can cache values derived from it
+        self.revision = 0
 
         self.load_config()
 
@@ -188,6 +228,7 @@ class ConfigService:
         """Load complete configuration from repository."""
         try:
             self.config = self.config_repository.load_config()
+            self.revision += 1
             if not self.config:
                 self.logger.warning("Empty or missing configuration file")
                 self._create_default_config()
@@ -207,6 +248,7 @@ class ConfigService:
         """Save current configuration to repository."""
         try:
             self._update_config_dict()
+            self.revision += 1
             success = self.config_repository.save_config(self.config)
 
             if success:
@@ -235,6 +277,7 @@ class ConfigService:
 
         self.weapon_profiles = self.weapon_manager.load_weapon_profiles(
             weapons_config, game_sensitivity)
+        self._rebuild_display_name_index()
 
         # Load hotkeys
         self.hotkeys = self.config.get("hotkeys", {})
@@ -252,15 +295,8 @@ class ConfigService:
             features = {}
 
         # Apply defaults for missing values
-        defaults = {
-            "tts_enabled": True,
-            "bomb_timer_enabled": False,
-            "follow_rcs_enabled": True
-        }
-
-        for key, default_value in defaults.items():
-            if key not in features:
-                features[key] = default_value
+        for key, default_value in _DEFAULT_FEATURES.items():
+            features.setdefault(key, default_value)
 
         self.config["features"] = features
 
@@ -320,6 +356,16 @@ class ConfigService:
 
         self.config["weapons"] = weapons_config
         self.config["hotkeys"] = self.hotkeys
+        self._rebuild_display_name_index()
+
+    def _rebuild_display_name_index(self) -> None:
+        """Index display names of configured weapons by internal name."""
+        self._display_name_index = {
+            weapon_data["name"]: weapon_data.get(
+                "display_name", weapon_data["name"])
+            for weapon_data in self.config.get("weapons", [])
+            if isinstance(weapon_data, dict) and weapon_data.get("name")
+        }
 
     def get_weapon_profile(self, name: str) -> Optional[WeaponProfile]:
         """Get weapon profile by name."""
@@ -345,10 +391,10 @@ class ConfigService:
         if profile:
             return profile.display_name
 
-        # Fallback to config lookup
-        for weapon_data in self.config.get("weapons", []):
-            if weapon_data.get("name") == internal_name:
-                return weapon_data.get("display_name", internal_name)
+        # Fallback to configured weapons without a loaded profile
+        display_name = self._display_name_index.get(internal_name)
+        if display_name is not None:
+            return display_name
 
         self.logger.warning(
             f"Display name not found for weapon: {internal_name}")
@@ -402,14 +448,9 @@ class ConfigService:
 
     def get_weapon_hotkeys(self) -> Dict[str, str]:
         """Get hotkeys assigned to weapons."""
-        weapon_hotkeys = {}
-        weapon_names = set(self.weapon_profiles.keys())
-
-        for key, value in self.hotkeys.items():
-            if key in weapon_names:
-                weapon_hotkeys[key] = value
-
-        return weapon_hotkeys
+        weapon_profiles = self.weapon_profiles
+        return {key: value for key, value in self.hotkeys.items()
+                if key in weapon_profiles}
 
     def assign_weapon_hotkey(self, weapon_name: str, hotkey: str) -> bool:
         """Assign hotkey to weapon."""
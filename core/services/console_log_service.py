@@ -2,11 +2,37 @@
 Console Log Monitoring Service for CS2 console.log file parsing.
 """
 import logging
+import msvcrt
+import os
 import re
 import time
 import threading
+from collections import deque
 from pathlib import Path
-from typing import Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any, List, Tuple
+
+import pywintypes
+import win32con
+import win32event
+import win32file
+
+
+FILE_LIST_DIRECTORY = 0x0001
+# CS2 keeps console.log open, so appends reliably surface as size changes
+NOTIFY_FILTER = win32con.FILE_NOTIFY_CHANGE_SIZE | win32con.FILE_NOTIFY_CHANGE_LAST_WRITE
+
+# Match ID is matched only at offsets where its literal prefix was found
+MATCH_ID_ANCHOR = "[A:1:"
+MATCH_ID_PATTERN = re.compile(r'\[A:1:(\d+):\d+\]')
+
+# Event anchors located with C-level substring search on lowercased content;
+# the regex only validates the ping value following a latency anchor
+MATCH_ANCHOR = b"server confirmed all players"
+PING_ANCHOR = b"latency "
+PING_VALUE_PATTERN = re.compile(rb"(\d+) msec")
+
+# Non-blank lines with surrounding whitespace already trimmed
+LINE_PATTERN = re.compile(r"\S(?:[^\n]*\S)?")
 
 
 class ConsoleLogMonitorService:
@@ -22,16 +48,43 @@ class ConsoleLogMonitorService:
         self.monitoring_thread: Optional[threading.Thread] = None
         self.last_position = 0
 
+        # Set by stop_monitoring to wake the change-notification wait
+        self._stop_event = win32event.CreateEvent(None, True, False, None)
+        # Upper bound between reads if a change notification is missed
+        self.safety_poll_ms = 500
+
+        # Reused read buffer for appended content, grown on demand up to the
+        # per-read cap so a large catch-up is scanned in bounded chunks
+        self._read_buffer = bytearray(64 * 1024)
+        self.max_read_bytes = 1024 * 1024
+
+        # console.log handle kept open across reads, owned by the monitor thread
+        self._log_file = None
+        self._console_log_path_str = ""
+        # On the polling paths, small appends are batched until this much is
+        # pending or the interval elapses; change notifications always read
+        self.read_batch_bytes = 4096
+        self.read_batch_interval = 0.5
+        self._last_read_time = 0.0
+        # Rate limit for checking that the open handle still matches the log path
+        self.path_check_interval = 1.0
+        self._last_path_check = 0.0
+
         self.callbacks: Dict[str, Callable] = {}
 
-        self.match_found_pattern = re.compile(r"Server confirmed all players", re.IGNORECASE)
-        self.ping_pattern = re.compile(r"latency (\d+) msec", re.IGNORECASE)
-        self.match_id_pattern = re.compile(r'\[A:1:(\d+):\d+\]')
+        self.match_id_anchor = MATCH_ID_ANCHOR
+        self.match_id_pattern = MATCH_ID_PATTERN
+        self.match_anchor = MATCH_ANCHOR
+        self.ping_anchor = PING_ANCHOR
+        self.ping_value_pattern = PING_VALUE_PATTERN
+        self.line_pattern = LINE_PATTERN
 
         self.last_match_time = 0
         self.match_cooldown = 8
+        # Insertion-ordered window of recent match IDs mirrored into a set
+        self.max_processed_matches = 64
+        self._processed_order = deque(maxlen=self.max_processed_matches)
         self.processed_matches = set()
-        self.max_processed_matches = 15
 
         self.events_processed = 0
         self.matches_detected = 0
@@ -72,6 +125,7 @@ class ConsoleLogMonitorService:
         try:
             self.last_position = self.console_log_path.stat().st_size
             self.monitoring_active = True
+            win32event.ResetEvent(self._stop_event)
 
             self.monitoring_thread = threading.Thread(
                 target=self._monitor_loop,
@@ -92,6 +146,7 @@ class ConsoleLogMonitorService:
 
         try:
             self.monitoring_active = False
+            win32event.SetEvent(self._stop_event)
 
             if self.monitoring_thread and self.monitoring_thread.is_alive():
                 self.monitoring_thread.join(timeout=2.0)
@@ -103,27 +158,78 @@ class ConsoleLogMonitorService:
             return False
 
     def _monitor_loop(self):
-        """Optimized monitoring loop."""
-        while self.monitoring_active:
-            try:
-                if not self.console_log_path or not self.console_log_path.exists():
-                    time.sleep(0.5)
-                    continue
+        """Wait for directory change notifications and read appended content."""
+        try:
+            dir_handle = win32file.CreateFile(
+                str(self.console_log_path.parent),
+                FILE_LIST_DIRECTORY,
+                win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+                None,
+                win32con.OPEN_EXISTING,
+                win32con.FILE_FLAG_BACKUP_SEMANTICS | win32con.FILE_FLAG_OVERLAPPED,
+                None
+            )
+        except pywintypes.error as e:
+            self.logger.warning(f"Change notifications unavailable, polling console.log: {e}")
+            self._poll_loop()
+            return
 
-                current_size = self.console_log_path.stat().st_size
+        overlapped = pywintypes.OVERLAPPED()
+        overlapped.hEvent = win32event.CreateEvent(None, True, False, None)
+        buffer = win32file.AllocateReadBuffer(8192)
+        log_name = self.console_log_path.name.lower()
+        pending = False
 
-                if current_size > self.last_position:
-                    with open(str(self.console_log_path), 'r', encoding='utf-8', errors='ignore') as f:
-                        f.seek(self.last_position)
-                        new_content = f.read()
+        try:
+            while self.monitoring_active:
+                if not pending:
+                    win32file.ReadDirectoryChangesW(dir_handle, buffer, False, NOTIFY_FILTER, overlapped)
+                    pending = True
+
+                result = win32event.WaitForMultipleObjects(
+                    [overlapped.hEvent, self._stop_event], False, self.safety_poll_ms)
+
+                if result == win32event.WAIT_OBJECT_0 + 1:
+                    break
+
+                if result == win32event.WAIT_OBJECT_0:
+                    pending = False
+                    size = win32file.GetOverlappedResult(dir_handle, overlapped, True)
+                    win32event.ResetEvent(overlapped.hEvent)
+
+                    # Skip changes to other files in the game directory
+                    if size and not any(
+                            name.lower() == log_name
+                            for _, name in win32file.FILE_NOTIFY_INFORMATION(buffer, size)):
+                        continue
 
-                    if new_content:
-                        self._process_new_content(new_content)
+                try:
+                    # Read at once on a notification so a match line is not
+                    # held back; only the safety poll timeout batches
+                    self._read_new_content(batch=result != win32event.WAIT_OBJECT_0)
+                except Exception as e:
+                    self.logger.error(f"Error in monitoring loop: {e}")
 
-                    self.last_position = current_size
+        except Exception as e:
+            self.logger.error(f"Change notification loop failed, polling console.log: {e}")
+            self._poll_loop()
+
+        finally:
+            if pending:
+                win32file.CancelIo(dir_handle)
+            dir_handle.Close()
+            overlapped.hEvent.Close()
+            self._close_log_file()
+
+    def _poll_loop(self):
+        """Fallback polling loop when change notifications are unavailable."""
+        while self.monitoring_active:
+            try:
+                self._read_new_content(batch=True)
 
-                elif current_size < self.last_position:
-                    self.last_position = 0
+                if self._log_file is None:
+                    time.sleep(0.5)
+                    continue
 
             except Exception as e:
                 self.logger.error(f"Error in monitoring loop: {e}")
@@ -132,29 +238,140 @@ class ConsoleLogMonitorService:
 
             time.sleep(0.05)
 
-    def _process_new_content(self, content: str):
-        """Process new content with optimized pattern matching."""
+        self._close_log_file()
+
+    def _open_log_file(self):
+        """Open console.log without blocking the game from truncating, renaming or deleting it."""
+        self._console_log_path_str = str(self.console_log_path)
+        handle = win32file.CreateFile(
+            self._console_log_path_str,
+            win32con.GENERIC_READ,
+            win32con.FILE_SHARE_READ | win32con.FILE_SHARE_WRITE | win32con.FILE_SHARE_DELETE,
+            None,
+            win32con.OPEN_EXISTING,
+            win32con.FILE_ATTRIBUTE_NORMAL,
+            None
+        )
+        fd = msvcrt.open_osfhandle(handle.Detach(), os.O_RDONLY)
+        return os.fdopen(fd, 'rb', buffering=0)
+
+    def _close_log_file(self):
+        """Close the cached console.log handle."""
+        if self._log_file is not None:
+            try:
+                self._log_file.close()
+            except OSError:
+                pass
+            self._log_file = None
+
+    def _read_new_content(self, batch: bool = False):
+        """Read and process content appended since the last read."""
+        if self._log_file is None:
+            if not self.console_log_path:
+                return
+            # Opening doubles as the existence check
+            try:
+                self._log_file = self._open_log_file()
+            except pywintypes.error:
+                return
+
+        current_size = os.fstat(self._log_file.fileno()).st_size
+
+        if current_size > self.last_position:
+            pending = current_size - self.last_position
+
+            # Under sustained polling, coalesce small appends into fewer reads
+            now = time.monotonic()
+            if (batch and pending < self.read_batch_bytes and
+                    now - self._last_read_time < self.read_batch_interval):
+                return
+
+            self._last_read_time = now
+            while pending > 0:
+                size = min(pending, self.max_read_bytes)
+                if len(self._read_buffer) < size:
+                    self._read_buffer = bytearray(size)
+
+                self._log_file.seek(self.last_position)
+                read_size = self._log_file.readinto(memoryview(self._read_buffer)[:size])
+                if not read_size:
+                    break
+
+                # Only complete lines are scanned; a trailing partial line is
+                # left in the file and read again once its newline arrives
+                end = self._read_buffer.rfind(b'\n', 0, read_size) + 1
+                if end == 0:
+                    if read_size < self.max_read_bytes:
+                        break
+                    end = read_size
+
+                self._process_new_content(self._read_buffer, end)
+                self.last_position += end
+                pending -= end
+
+                if end < read_size and size < self.max_read_bytes:
+                    break
+
+        elif current_size < self.last_position:
+            self.last_position = 0
+
+        elif time.monotonic() - self._last_path_check >= self.path_check_interval:
+            # Handle saw no growth: reopen if the log path now names another file
+            self._last_path_check = time.monotonic()
+            try:
+                replaced = os.stat(self._console_log_path_str).st_size != current_size
+            except OSError:
+                replaced = True
+            if replaced:
+                self._close_log_file()
+
+    def _scan_events(self, lowered: bytes) -> List[Tuple[int, Optional[int]]]:
+        """Locate match confirmations (None) and ping values in lowercased content, in order."""
+        events = []
+
+        index = lowered.find(self.match_anchor)
+        while index != -1:
+            events.append((index, None))
+            index = lowered.find(self.match_anchor, index + len(self.match_anchor))
+
+        index = lowered.find(self.ping_anchor)
+        while index != -1:
+            value = self.ping_value_pattern.match(lowered, index + len(self.ping_anchor))
+            if value is not None:
+                events.append((index, int(value.group(1))))
+            index = lowered.find(self.ping_anchor, index + len(self.ping_anchor))
+
+        events.sort(key=lambda event: event[0])
+        return events
+
+    def _process_new_content(self, content: bytearray, length: Optional[int] = None):
+        """Process the first length bytes of raw content with a single anchor scan."""
         try:
-            lines = content.split('\n')
-            self.events_processed += len(lines)
+            end = len(content) if length is None else length
+            self.events_processed += content.count(b'\n', 0, end) + 1
+
+            # ASCII lowercasing keeps offsets aligned with the raw content
+            for start, ping in self._scan_events(content[:end].lower()):
+                if ping is None:
+                    # Match ID lives on the same line as the confirmation
+                    line_start = content.rfind(b'\n', 0, start) + 1
+                    line_end = content.find(b'\n', start + len(self.match_anchor), end)
+                    line = content[line_start:line_end if line_end != -1 else end]
+                    line = line.decode('utf-8', errors='ignore').strip()
 
-            for line in lines:
-                line = line.strip()
-                if not line:
-                    continue
-
-                if self.match_found_pattern.search(line):
                     if self._handle_match_found(line):
                         self.matches_detected += 1
-
-                elif self.ping_pattern.search(line):
-                    ping_match = self.ping_pattern.search(line)
-                    if ping_match:
-                        ping_value = int(ping_match.group(1))
-                        self._trigger_callback('ping_update', ping_value)
-
-                if 'new_line' in self.callbacks:
-                    self._trigger_callback('new_line', line)
+                else:
+                    self._trigger_callback('ping_update', ping)
+
+            new_line_callback = self.callbacks.get('new_line')
+            if new_line_callback is not None:
+                text = content[:end].decode('utf-8', errors='ignore')
+                for line in self.line_pattern.finditer(text):
+                    try:
+                        new_line_callback(line.group())
+                    except Exception as e:
+                        self.logger.error(f"Error in callback for new_line: {e}")
 
         except Exception as e:
             self.logger.error(f"Error processing content: {e}")
@@ -163,19 +380,14 @@ class ConsoleLogMonitorService:
         """Handle match found with duplicate detection."""
         try:
             match_id = self._extract_match_id(line)
-            current_time = time.time()
+            current_time = time.monotonic()
 
             if (current_time - self.last_match_time > self.match_cooldown and
                 match_id not in self.processed_matches):
 
                 self.logger.info("Match found detected in console log")
                 self.last_match_time = current_time
-                self.processed_matches.add(match_id)
-
-                if len(self.processed_matches) > self.max_processed_matches:
-                    sorted_matches = sorted(self.processed_matches)
-                    keep_count = self.max_processed_matches // 2
-                    self.processed_matches = set(sorted_matches[-keep_count:])
+                self._remember_match(match_id)
 
                 self._trigger_callback('match_found', line)
                 return True
@@ -184,18 +396,29 @@ class ConsoleLogMonitorService:
             self.logger.error(f"Error handling match found: {e}")
         return False
 
+    def _remember_match(self, match_id: str) -> None:
+        """Record a match ID, evicting the oldest once the window is full."""
+        if len(self._processed_order) == self._processed_order.maxlen:
+            self.processed_matches.discard(self._processed_order[0])
+        self._processed_order.append(match_id)
+        self.processed_matches.add(match_id)
+
     def _extract_match_id(self, line: str) -> str:
         """Extract match ID from console line."""
-        match_id_match = self.match_id_pattern.search(line)
-        if match_id_match is not None:
-            return match_id_match.group(1)
+        index = line.find(self.match_id_anchor)
+        while index != -1:
+            match_id_match = self.match_id_pattern.match(line, index)
+            if match_id_match is not None:
+                return match_id_match.group(1)
+            index = line.find(self.match_id_anchor, index + 1)
         return ""
 
     def _trigger_callback(self, event_type: str, data):
         """Trigger registered callback."""
-        if event_type in self.callbacks:
+        callback = self.callbacks.get(event_type)
+        if callback is not None:
             try:
-                self.callbacks[event_type](data)
+                callback(data)
             except Exception as e:
                 self.logger.error(f"Error in callback for {event_type}: {e}")
 
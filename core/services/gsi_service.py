@@ -3,17 +3,63 @@ Game State Integration service for Counter-Strike 2.
 """
 import json
 import logging
-import re
 import threading
 import time
 import winreg
 import hashlib
 from pathlib import Path
-from typing import Dict, Any, Optional, Callable
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Any, Optional, Callable, Tuple
+from http.server import HTTPServer, ThreadingHTTPServer, BaseHTTPRequestHandler
 from concurrent.futures import ThreadPoolExecutor
 
-from core.models.player_state import PlayerState
+from core.models.player_state import PlayerState, WeaponState
+
+# orjson parses request bodies straight from bytes; stdlib json also accepts
+# bytes, so the fallback needs no decode step either
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Complete acknowledgement for a GSI post, written with a single send
+_OK_RESPONSE = (
+    b"HTTP/1.1 200 OK\r\n"
+    b"Content-Type: text/plain\r\n"
+    b"Content-Length: 2\r\n"
+    b"\r\n"
+    b"OK"
+)
+
+# ASCII-only lowercasing; unlike str.lower it never changes string length
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+
+
+def _find_vdf_paths(content: str) -> list[str]:
+    """Extract the quoted values of "path" keys from libraryfolders.vdf content."""
+    values = []
+    # Offsets stay aligned with content, so keys match case-insensitively
+    lowered = content.translate(_ASCII_LOWER)
+    key = '"path"'
+    index = lowered.find(key)
+
+    while index != -1:
+        next_search = index + 1
+        # Key and value are separated by whitespace only
+        key_end = index + len(key)
+        value_start = key_end
+        while value_start < len(content) and content[value_start].isspace():
+            value_start += 1
+
+        if value_start > key_end and content.startswith('"', value_start):
+            value_end = content.find('"', value_start + 1)
+            if value_end > value_start + 1:
+                values.append(content[value_start + 1:value_end])
+                next_search = value_end + 1
+
+        index = lowered.find(key, next_search)
+
+    return values
 
 
 class GSIConfigService:
@@ -23,6 +69,8 @@ class GSIConfigService:
         self.logger = logging.getLogger("GSIConfigService")
         self.config_name = "rcs"
         self.config_filename = f"gamestate_integration_{self.config_name}.cfg"
+        # CS2 install location does not move while the app is running
+        self._cached_cs2_path: Optional[Path] = None
 
     def generate_config_file(self, gsi_config: Dict[str, Any]) -> bool:
         """
@@ -38,7 +86,7 @@ class GSIConfigService:
             config_file_path = cs2_config_path / self.config_filename
 
             if config_file_path.exists():
-                self.logger.debug(f"GSI config file already exists: {config_file_path}")
+                self.logger.debug("GSI config file already exists: %s", config_file_path)
                 return True
 
             config_content = self._generate_config_content(gsi_config)
@@ -50,11 +98,15 @@ class GSIConfigService:
             return True
 
         except Exception as e:
+            self._cached_cs2_path = None
             self.logger.error(f"Failed to generate GSI config file: {e}")
             return False
 
     def _find_cs2_config_directory(self) -> Optional[Path]:
         """Find CS2 configuration directory."""
+        if self._cached_cs2_path is not None:
+            return self._cached_cs2_path
+
         try:
             steam_paths = self._get_steam_paths()
 
@@ -65,7 +117,8 @@ class GSIConfigService:
                 cs2_config_path = steam_path / "steamapps/common/Counter-Strike Global Offensive/game/csgo/cfg"
 
                 if cs2_config_path.exists():
-                    self.logger.debug(f"Found CS2 config directory: {cs2_config_path}")
+                    self.logger.debug("Found CS2 config directory: %s", cs2_config_path)
+                    self._cached_cs2_path = cs2_config_path
                     return cs2_config_path
 
             return None
@@ -103,7 +156,8 @@ class GSIConfigService:
                 if lib_path not in steam_paths:
                     steam_paths.append(lib_path)
 
-        self.logger.debug(f"Found Steam paths: {[str(p) for p in steam_paths]}")
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Found Steam paths: %s", [str(p) for p in steam_paths])
         return steam_paths
 
     def _parse_libraryfolders_vdf(self, steam_path: Path) -> list[Path]:
@@ -114,23 +168,22 @@ class GSIConfigService:
             vdf_path = steam_path / "config" / "libraryfolders.vdf"
 
             if not vdf_path.exists():
-                self.logger.debug(f"libraryfolders.vdf not found at {vdf_path}")
+                self.logger.debug("libraryfolders.vdf not found at %s", vdf_path)
                 return library_paths
 
             with open(vdf_path, 'r', encoding='utf-8', errors='ignore') as f:
                 content = f.read()
 
-            path_pattern = r'"path"\s+"([^"]+)"'
-            matches = re.findall(path_pattern, content, re.IGNORECASE)
+            matches = _find_vdf_paths(content)
 
             for match in matches:
                 library_path = Path(match.replace('\\\\', '\\'))
 
                 if library_path.exists():
                     library_paths.append(library_path)
-                    self.logger.debug(f"Found Steam library: {library_path}")
+                    self.logger.debug("Found Steam library: %s", library_path)
                 else:
-                    self.logger.debug(f"Steam library path does not exist: {library_path}")
+                    self.logger.debug("Steam library path does not exist: %s", library_path)
 
         except Exception as e:
             self.logger.warning(f"Error parsing libraryfolders.vdf: {e}")
@@ -163,6 +216,11 @@ class GSIConfigService:
 class GSIRequestHandler(BaseHTTPRequestHandler):
     """HTTP request handler for GSI data reception."""
 
+    # Persistent connections let CS2 reuse one socket for every post
+    protocol_version = "HTTP/1.1"
+    # Idle keep-alive connections are dropped after this many seconds
+    timeout = 30
+
     def __init__(self, gsi_service, *args, **kwargs):
         self.gsi_service = gsi_service
         super().__init__(*args, **kwargs)
@@ -172,31 +230,35 @@ class GSIRequestHandler(BaseHTTPRequestHandler):
         try:
             content_length = int(self.headers.get('Content-Length', 0))
             if content_length == 0:
-                self.send_response(400)
-                self.end_headers()
+                self._send_empty_response(400)
                 return
 
             raw_data = self.rfile.read(content_length)
 
             try:
-                gsi_data = json.loads(raw_data.decode('utf-8'))
+                gsi_data = _json_loads(raw_data)
             except json.JSONDecodeError as e:
                 self.gsi_service.logger.error(f"JSON decode error: {e}")
-                self.send_response(400)
-                self.end_headers()
+                self._send_empty_response(400)
                 return
 
             self.gsi_service._submit_gsi_data(gsi_data)
 
-            self.send_response(200)
-            self.send_header('Content-type', 'text/plain')
-            self.end_headers()
-            self.wfile.write(b'OK')
+            self.wfile.write(_OK_RESPONSE)
 
         except Exception as e:
             self.gsi_service.logger.error(f"Request handling error: {e}")
-            self.send_response(500)
-            self.end_headers()
+            # The request body may be partly unread, so the stream cannot be reused
+            self.close_connection = True
+            self._send_empty_response(500)
+
+    def _send_empty_response(self, code: int) -> None:
+        """Send a bodiless response that keeps the connection's framing intact."""
+        self.send_response(code)
+        self.send_header('Content-Length', '0')
+        if self.close_connection:
+            self.send_header('Connection', 'close')
+        self.end_headers()
 
     def log_message(self, format, *args):
         """Disable default HTTP logging."""
@@ -219,12 +281,15 @@ class GSIService:
 
         self.last_update_time = 0.0
         self.update_callbacks: Dict[str, Callable[[PlayerState], None]] = {}
+        # Immutable (name, callback) pairs rebuilt on (un)registration and read
+        # without the lock by the dispatch path
+        self._callbacks_snapshot: Tuple[Tuple[str, Callable[[PlayerState], None]], ...] = ()
         self.current_player_state: Optional[PlayerState] = None
         self.connection_status = "Disconnected"
         self.lock = threading.Lock()
 
         self._payload_cache: Dict[str, Any] = {}
-        self._last_payload_hash: Optional[str] = None
+        self._last_payload_hash: Optional[bytes] = None
         self._processed_count = 0
         self._cache_hits = 0
         self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="GSI")
@@ -234,6 +299,8 @@ class GSIService:
             'active_weapon_name', 'active_weapon_ammo', 'bomb_planted', 'has_defuse_kit'
         }
         self._last_field_values: Dict[str, Any] = {}
+        # WeaponState instances from the latest update keyed by their raw fields
+        self._weapon_cache: Dict[Tuple[Any, ...], WeaponState] = {}
 
         self.config_service = GSIConfigService()
 
@@ -257,7 +324,9 @@ class GSIService:
             def handler_factory(*args, **kwargs):
                 return GSIRequestHandler(self, *args, **kwargs)
 
-            self.server = HTTPServer((self.host, self.port), handler_factory)
+            # One daemon thread per connection so a stalled client cannot
+            # hold up CS2's posts
+            self.server = ThreadingHTTPServer((self.host, self.port), handler_factory)
 
             self.server_thread = threading.Thread(
                 target=self._run_server,
@@ -320,7 +389,9 @@ class GSIService:
         """Submit GSI data for async processing."""
         try:
             payload_str = json.dumps(gsi_data, sort_keys=True)
-            payload_hash = hashlib.md5(payload_str.encode()).hexdigest()
+            # Only compared for equality, so a short raw digest suffices
+            payload_hash = hashlib.blake2b(
+                payload_str.encode(), digest_size=8).digest()
 
             if payload_hash == self._last_payload_hash:
                 self._cache_hits += 1
@@ -337,10 +408,11 @@ class GSIService:
         """Process incoming GSI data with change detection."""
         try:
             self.connection_status = "Connected"
-            self.last_update_time = time.time()
+            now = time.time()
+            self.last_update_time = now
             self._processed_count += 1
 
-            player_state = self._extract_player_state(gsi_data)
+            player_state = self._extract_player_state(gsi_data, now)
 
             if player_state:
                 current_fields = self._extract_tracked_fields(player_state)
@@ -383,7 +455,7 @@ class GSIService:
 
     def _execute_callbacks_async(self, player_state: PlayerState) -> None:
         """Execute callbacks asynchronously to avoid blocking."""
-        for callback_name, callback in self.update_callbacks.items():
+        for callback_name, callback in self._callbacks_snapshot:
             try:
                 self._executor.submit(self._safe_callback_execution, callback_name, callback, player_state)
             except Exception as e:
@@ -397,7 +469,8 @@ class GSIService:
             self.logger.error(f"Callback '{callback_name}' execution error: {e}")
 
     def _extract_player_state(
-            self, gsi_data: Dict[str, Any]) -> Optional[PlayerState]:
+            self, gsi_data: Dict[str, Any],
+            timestamp: Optional[float] = None) -> Optional[PlayerState]:
         """Extract player state from GSI data with caching."""
         try:
             player_data = gsi_data.get("player", {})
@@ -412,13 +485,7 @@ class GSIService:
 
             has_defuse_kit = "defusekit" in state
 
-            weapons = self._extract_weapons(weapons_data)
-
-            active_weapon = None
-            for weapon in weapons.values():
-                if weapon.state == "active":
-                    active_weapon = weapon
-                    break
+            weapons, active_weapon = self._extract_weapons(weapons_data)
 
             return PlayerState(
                 health=state.get("health", 0),
@@ -427,7 +494,7 @@ class GSIService:
                 burning=state.get("burning", 0),
                 weapons=weapons,
                 active_weapon=active_weapon,
-                timestamp=time.time(),
+                timestamp=time.time() if timestamp is None else timestamp,
                 has_defuse_kit=has_defuse_kit,
                 bomb_planted=bomb_planted
             )
@@ -436,36 +503,54 @@ class GSIService:
             self.logger.error(f"Player state extraction error: {e}")
             return None
 
-    def _extract_weapons(self, weapons_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Extract weapons from GSI data."""
-        from core.models.player_state import WeaponState
-
-        weapons = {}
+    def _extract_weapons(
+            self,
+            weapons_data: Dict[str, Any]) -> Tuple[Tuple[WeaponState, ...], Optional[WeaponState]]:
+        """Extract weapons from GSI data along with the first active weapon."""
+        weapons = []
+        active_weapon = None
+        # Weapons whose fields are unchanged since the previous update are reused
+        previous_weapons = self._weapon_cache
+        current_weapons = {}
 
         for slot, weapon_data in weapons_data.items():
             try:
-                weapon = WeaponState(
-                    name=weapon_data.get("name", "unknown"),
-                    paintkit=weapon_data.get("paintkit", "default"),
-                    type=weapon_data.get("type", "unknown"),
-                    state=weapon_data.get("state", "inactive"),
-                    ammo_clip=weapon_data.get("ammo_clip", 0),
-                    ammo_clip_max=weapon_data.get("ammo_clip_max", 0),
-                    ammo_reserve=weapon_data.get("ammo_reserve", 0)
+                get = weapon_data.get
+                fields = (
+                    get("name", "unknown"),
+                    get("paintkit", "default"),
+                    get("type", "unknown"),
+                    get("state", "inactive"),
+                    get("ammo_clip", 0),
+                    get("ammo_clip_max", 0),
+                    get("ammo_reserve", 0)
                 )
-                weapons[slot] = weapon
+                try:
+                    weapon = previous_weapons.get(fields)
+                    if weapon is None:
+                        weapon = WeaponState(*fields)
+                    current_weapons[fields] = weapon
+                except TypeError:
+                    # Unhashable field values (lists, dicts) bypass the cache
+                    weapon = WeaponState(*fields)
+                weapons.append(weapon)
+
+                if active_weapon is None and weapon.state == "active":
+                    active_weapon = weapon
 
             except Exception as e:
                 self.logger.warning(f"Weapon extraction error for slot {slot}: {e}")
                 continue
 
-        return weapons
+        self._weapon_cache = current_weapons
+        return tuple(weapons), active_weapon
 
     def register_callback(
             self, name: str, callback: Callable[[PlayerState], None]) -> None:
         """Register callback for GSI updates."""
         with self.lock:
             self.update_callbacks[name] = callback
+            self._callbacks_snapshot = tuple(self.update_callbacks.items())
             self.logger.debug(f"Callback registered: {name}")
 
     def unregister_callback(self, name: str) -> None:
@@ -473,6 +558,7 @@ class GSIService:
         with self.lock:
             if name in self.update_callbacks:
                 del self.update_callbacks[name]
+                self._callbacks_snapshot = tuple(self.update_callbacks.items())
                 self.logger.debug(f"Callback unregistered: {name}")
 
     def get_connection_status(self) -> Dict[str, Any]:
@@ -244,7 +244,7 @@ class HotkeyService:
     def _handle_hotkey_trigger(self, identifier: str) -> None:
         """Handle hotkey trigger event."""
         try:
-            self.logger.debug(f"Hotkey triggered: {identifier}")
+            self.logger.debug("Hotkey triggered: %s", identifier)
 
             # System actions
             if identifier == "toggle_recoil":
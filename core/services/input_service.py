@@ -4,7 +4,7 @@ System input management service using Windows SendInput API.
 import ctypes
 import logging
 import time
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 import win32api
 import win32con
@@ -21,6 +21,8 @@ class WindowsInputAPI:
     MOUSEEVENTF_RIGHTUP = 0x0010
     MOUSEEVENTF_MIDDLEDOWN = 0x0020
     MOUSEEVENTF_MIDDLEUP = 0x0040
+    MOUSEEVENTF_VIRTUALDESK = 0x4000
+    MOUSEEVENTF_ABSOLUTE = 0x8000
 
     # Input types
     INPUT_MOUSE = 0
@@ -154,6 +156,9 @@ class InputService:
         self._initialize_api()
         self._key_mappings = KeyMapping.get_all_mappings()
         self._last_key_states = {}
+        # Games that sample the cursor once per frame need the click to stay
+        # at its position for a few frames before the cursor is restored
+        self.click_restore_delay = 0.05
         self.logger.debug("Input service initialized")
 
     def _initialize_api(self) -> None:
@@ -238,6 +243,50 @@ class InputService:
         except Exception as e:
             self.logger.error(f"Mouse click failed ({button}): {e}")
 
+    def mouse_click_at(self, x: int, y: int,
+                       restore_pos: Optional[Tuple[int, int]] = None) -> None:
+        """
+        Move to absolute screen position and left click in one SendInput batch.
+
+        When restore_pos is given, the cursor is moved back to it in a
+        separate SendInput call once click_restore_delay has elapsed.
+        """
+        try:
+            # Absolute coordinates are normalized to 0..65535 over the virtual desktop
+            left = win32api.GetSystemMetrics(win32con.SM_XVIRTUALSCREEN)
+            top = win32api.GetSystemMetrics(win32con.SM_YVIRTUALSCREEN)
+            width = max(2, win32api.GetSystemMetrics(win32con.SM_CXVIRTUALSCREEN))
+            height = max(2, win32api.GetSystemMetrics(win32con.SM_CYVIRTUALSCREEN))
+
+            move_flags = (WindowsInputAPI.MOUSEEVENTF_MOVE | WindowsInputAPI.MOUSEEVENTF_ABSOLUTE |
+                          WindowsInputAPI.MOUSEEVENTF_VIRTUALDESK)
+
+            def send(events):
+                inputs = (INPUT * len(events))()
+                for i, (pos_x, pos_y, flags) in enumerate(events):
+                    norm_x = ((pos_x - left) * 65535) // (width - 1) if pos_x is not None else 0
+                    norm_y = ((pos_y - top) * 65535) // (height - 1) if pos_y is not None else 0
+                    inputs[i].type = WindowsInputAPI.INPUT_MOUSE
+                    inputs[i].union.mi = MOUSEINPUT(
+                        dx=norm_x, dy=norm_y, mouseData=0, dwFlags=flags,
+                        time=0, dwExtraInfo=None
+                    )
+                self.user32.SendInput(len(events), inputs, ctypes.sizeof(INPUT))
+
+            send([
+                (x, y, move_flags),
+                (None, None, WindowsInputAPI.MOUSEEVENTF_LEFTDOWN),
+                (None, None, WindowsInputAPI.MOUSEEVENTF_LEFTUP),
+            ])
+            self.logger.debug("Mouse clicked at (%d, %d)", x, y)
+
+            if restore_pos is not None:
+                time.sleep(self.click_restore_delay)
+                send([(restore_pos[0], restore_pos[1], move_flags)])
+
+        except Exception as e:
+            self.logger.error("Mouse click failed at (%d, %d): %s", x, y, e)
+
     def key_down(self, vk_code: int) -> None:
         """Press key down."""
         try:
@@ -251,7 +300,7 @@ class InputService:
             )
             self.user32.SendInput(
                 1, ctypes.byref(input_obj), ctypes.sizeof(INPUT))
-            self.logger.debug(f"Key pressed: VK_{vk_code}")
+            self.logger.debug("Key pressed: VK_%s", vk_code)
         except Exception as e:
             self.logger.error(f"Key down failed (VK_{vk_code}): {e}")
 
@@ -268,7 +317,7 @@ class InputService:
             )
             self.user32.SendInput(
                 1, ctypes.byref(input_obj), ctypes.sizeof(INPUT))
-            self.logger.debug(f"Key released: VK_{vk_code}")
+            self.logger.debug("Key released: VK_%s", vk_code)
         except Exception as e:
             self.logger.error(f"Key up failed (VK_{vk_code}): {e}")
 
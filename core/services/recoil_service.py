@@ -6,6 +6,7 @@ import random
 import threading
 from typing import Dict, Optional, Callable, Any, List
 
+import numpy as np
 import win32con
 
 from core.models.weapon import WeaponProfile
@@ -72,7 +73,7 @@ class RecoilService:
 
             # 2. Check if weapon is actually changing
             if self.current_weapon == weapon_name:
-                self.logger.debug(f"Weapon reconfirmed: {weapon_name}")
+                self.logger.debug("Weapon reconfirmed: %s", weapon_name)
                 return True  # No change, operation is successful
 
             # 3. Weapon is changing, update state and determine side-effects
@@ -271,8 +272,8 @@ class RecoilService:
                     # No weapon available for compensation
                     break
 
-                pattern = weapon.calculated_pattern
-                if not pattern:
+                pattern = weapon.pattern_buffer
+                if not len(pattern):
                     self.logger.error("Empty pattern for weapon")
                     break
 
@@ -311,7 +312,7 @@ class RecoilService:
     def _execute_compensation_sequence(
             self,
             weapon: WeaponProfile,
-            pattern: List,
+            pattern: np.ndarray,
             key_trigger: int) -> bool:
         """Execute complete compensation sequence for given weapon."""
         begin_time = self.timing_service.system_time()
@@ -341,19 +342,24 @@ class RecoilService:
             scale_x = random.gauss(1.0, sigma)
             scale_y = random.gauss(1.0, sigma)
             
-            self.logger.debug(f"Spray variation: scale_x={scale_x:.3f}, scale_y={scale_y:.3f}")
+            self.logger.debug(
+                "Spray variation: scale_x=%.3f, scale_y=%.3f", scale_x, scale_y)
+
+        # Rows of (dx, dy, delay) as Python floats, one conversion per spray
+        rows = pattern.tolist()
+        last_index = len(rows) - 1
 
-        for i, point in enumerate(pattern):
+        for i, (point_dx, point_dy, point_delay) in enumerate(rows):
             if self.weapon_change_event.is_set():
-                self.logger.debug(f"Weapon change detected during sequence at index {i}")
+                self.logger.debug("Weapon change detected during sequence at index %d", i)
                 return False
 
             if not self.input_service.is_key_pressed(key_trigger) or self.stop_event.is_set():
-                self.logger.debug(f"Sequence interrupted at index {i}")
+                self.logger.debug("Sequence interrupted at index %d", i)
                 return False
 
             if i == 0:
-                delay = point.delay / weapon.sleep_divider - weapon.sleep_suber
+                delay = point_delay / weapon.sleep_divider - weapon.sleep_suber
                 accumulated_time = delay
                 self.timing_service.combined_sleep(accumulated_time, begin_time)
                 continue
@@ -361,8 +367,8 @@ class RecoilService:
             # Apply trajectory variation
             # The scale is constant for this spray, preserving the pattern shape
             # but changing its overall size/intensity.
-            jittered_dx = point.dx * scale_x
-            jittered_dy = point.dy * scale_y
+            jittered_dx = point_dx * scale_x
+            jittered_dy = point_dy * scale_y
 
             self.raw_recoil_x += -jittered_dx
             self.raw_recoil_y += jittered_dy
@@ -387,16 +393,16 @@ class RecoilService:
                 self.accumulated_x += dx_int
                 self.accumulated_y += dy_int
 
-            if i < len(pattern) - 1:
+            if i < last_index:
                 if i <= weapon.multiple:
-                    intermediate_sleep = (point.delay / weapon.sleep_divider - weapon.sleep_suber) / 2
+                    intermediate_sleep = (point_delay / weapon.sleep_divider - weapon.sleep_suber) / 2
                 else:
-                    intermediate_sleep = (point.delay / weapon.sleep_divider - weapon.sleep_suber) * 2 / 3
+                    intermediate_sleep = (point_delay / weapon.sleep_divider - weapon.sleep_suber) * 2 / 3
 
                 self.timing_service.combined_sleep_2(intermediate_sleep)
 
                 # Apply timing jitter if enabled (Gaussian distribution)
-                delay_time = point.delay / weapon.sleep_divider - weapon.sleep_suber
+                delay_time = point_delay / weapon.sleep_divider - weapon.sleep_suber
                 if weapon.jitter_timing > 0:
                     # Gaussian jitter: std_dev = jitter_ms / 3 (99.7% within +/- jitter_ms)
                     std_dev = weapon.jitter_timing / 3.0
@@ -36,6 +36,16 @@ class ScreenCaptureService:
 
         self.common_regions = {}
 
+        # Window handles by title, revalidated with IsWindow before reuse
+        self._hwnd_cache: Dict[str, int] = {}
+
+        # Last window rect per title with its timestamp (ms)
+        self._last_window_info: Dict[str, Tuple[float, Tuple[int, int, int, int]]] = {}
+        self.window_info_ttl_ms = 500
+
+        # Per-channel match tables keyed by (target color, tolerance)
+        self._color_luts: Dict[Tuple[Tuple[int, int, int], int], np.ndarray] = {}
+
         self.logger.info("Screen Capture Service initialized")
 
     def _cleanup_cache(self):
@@ -64,10 +74,28 @@ class ScreenCaptureService:
         """Generates a unique key for a given region."""
         return f"{region[0]}_{region[1]}_{region[2]}_{region[3]}"
 
+    def get_hwnd(self, window_name: str = "Counter-Strike 2") -> Optional[int]:
+        """Get window handle, reusing the cached one while the window exists."""
+        hwnd = self._hwnd_cache.get(window_name)
+        if hwnd and win32gui.IsWindow(hwnd):
+            return hwnd
+
+        hwnd = win32gui.FindWindow(None, window_name)
+        if hwnd:
+            self._hwnd_cache[window_name] = hwnd
+        else:
+            self._hwnd_cache.pop(window_name, None)
+        return hwnd or None
+
     def get_window_info(self, window_name: str = "Counter-Strike 2") -> Optional[Tuple[int, int, int, int]]:
-        """Get window position and dimensions."""
+        """Get window position and dimensions, reusing results younger than window_info_ttl_ms."""
+        current_time = time.time() * 1000
+        cached = self._last_window_info.get(window_name)
+        if cached is not None and current_time - cached[0] <= self.window_info_ttl_ms:
+            return cached[1]
+
         try:
-            hwnd = win32gui.FindWindow(None, window_name)
+            hwnd = self.get_hwnd(window_name)
             if not hwnd:
                 self.logger.warning(f"Window '{window_name}' not found")
                 return None
@@ -77,7 +105,9 @@ class ScreenCaptureService:
             width = right - x
             height = bottom - y
 
-            return (x, y, width, height)
+            window_info = (x, y, width, height)
+            self._last_window_info[window_name] = (current_time, window_info)
+            return window_info
 
         except Exception as e:
             self.logger.error(f"Error getting window info: {e}")
@@ -86,7 +116,7 @@ class ScreenCaptureService:
     def is_window_foreground(self, window_name: str = "Counter-Strike 2") -> bool:
         """Check if specified window is in foreground."""
         try:
-            hwnd = win32gui.FindWindow(None, window_name)
+            hwnd = self.get_hwnd(window_name)
             if not hwnd:
                 return False
 
@@ -100,7 +130,7 @@ class ScreenCaptureService:
     def bring_window_to_front(self, window_name: str = "Counter-Strike 2") -> bool:
         """Bring specified window to foreground."""
         try:
-            hwnd = win32gui.FindWindow(None, window_name)
+            hwnd = self.get_hwnd(window_name)
             if not hwnd:
                 self.logger.warning(f"Window '{window_name}' not found")
                 return False
@@ -155,48 +185,6 @@ class ScreenCaptureService:
             self.logger.error(f"Error capturing region {region}: {e}")
             return None
 
-    def get_pixel_color(self, x: int, y: int, sample_size: int = 3) -> Optional[Tuple[int, int, int]]:
-        """
-        Retrieves the color of a pixel at the given coordinates,
-        using an optimized sampling method with caching.
-        """
-        try:
-            effective_sample_size = max(sample_size, 5)
-            half_size = effective_sample_size // 2
-            region = (x - half_size, y - half_size, effective_sample_size, effective_sample_size)
-
-            frame = self.capture_region(region, use_cache=True)
-            if frame is None:
-                return None
-
-            center_x = effective_sample_size // 2
-            center_y = effective_sample_size // 2
-
-            if sample_size == 1:
-                if frame.shape[0] > center_y and frame.shape[1] > center_x:
-                    pixel = frame[center_y, center_x]
-                    return (int(pixel[0]), int(pixel[1]), int(pixel[2]))
-            else:
-                start_x = center_x - sample_size // 2
-                end_x = start_x + sample_size
-                start_y = center_y - sample_size // 2
-                end_y = start_y + sample_size
-
-                start_x = max(0, start_x)
-                start_y = max(0, start_y)
-                end_x = min(frame.shape[1], end_x)
-                end_y = min(frame.shape[0], end_y)
-
-                sample_region = frame[start_y:end_y, start_x:end_x]
-                avg_color = np.mean(sample_region.reshape(-1, 3), axis=0)
-                return (int(avg_color[0]), int(avg_color[1]), int(avg_color[2]))
-
-            return None
-
-        except Exception as e:
-            self.logger.error(f"Error getting pixel color at ({x}, {y}): {e}")
-            return None
-
     def is_color_similar(self, color1: Tuple[int, int, int], color2: Tuple[int, int, int], tolerance: int = 20) -> bool:
         """Compares two colors with a given tolerance."""
         try:
@@ -258,35 +246,44 @@ class ScreenCaptureService:
             self.logger.error(f"Error calculating Accept button position: {e}")
             return (0, 0)
 
-    def verify_accept_button_color(self, window_info: Tuple[int, int, int, int],
-                                     target_color: Tuple[int, int, int] = (54, 183, 82),
-                                     tolerance: int = 20) -> bool:
+    def _get_color_lut(self, target_color: Tuple[int, int, int], tolerance: int) -> np.ndarray:
+        """Returns a (3, 256) table marking channel values within tolerance of the target."""
+        key = (tuple(target_color), tolerance)
+        lut = self._color_luts.get(key)
+        if lut is None:
+            values = np.arange(256, dtype=np.int16)
+            lut = np.abs(values[None, :] - np.asarray(target_color, dtype=np.int16)[:, None]) <= tolerance
+            self._color_luts[key] = lut
+        return lut
+
+    def accept_button_match_ratio(self, button_x: int, button_y: int,
+                                  target_color: Tuple[int, int, int],
+                                  tolerance: int = 20,
+                                  width: int = 48,
+                                  height: int = 16) -> Optional[float]:
         """
-        Verifies the color of the 'Accept' button within the game window.
+        Captures one region across the 'Accept' button and returns the
+        fraction of its pixels within tolerance of the target color.
         """
         try:
-            button_x, button_y = self.calculate_accept_button_position(window_info)
-
-            sample_region = (button_x - 5, button_y - 5, 11, 11)
-            frame = self.capture_region(sample_region, use_cache=True)
+            region = (button_x - width // 2, button_y - height // 2, width, height)
+            # Polled faster than the cache TTL, so always grab a fresh frame
+            frame = self.capture_region(region, use_cache=False)
 
             if frame is None:
-                return False
-
-            center_pixels = frame[4:7, 4:7]
-            avg_color = np.mean(center_pixels.reshape(-1, 3), axis=0)
+                return None
 
-            avg_color_int = (int(avg_color[0]), int(avg_color[1]), int(avg_color[2]))
-            is_similar = self.is_color_similar(avg_color_int, target_color, tolerance)
+            # Table lookups on the raw uint8 channels replace subtract/abs/compare
+            lut = self._get_color_lut(target_color, tolerance)
+            pixels = frame.reshape(-1, 3)
+            matches = lut[0][pixels[:, 0]] & lut[1][pixels[:, 1]] & lut[2][pixels[:, 2]]
+            ratio = float(np.count_nonzero(matches)) / len(pixels)
 
             if self.capture_count % 10 == 0:
-                if is_similar:
-                    self.logger.debug(f"Accept button color verified at ({button_x}, {button_y}): {avg_color_int}")
-                else:
-                    self.logger.debug(f"Accept button color mismatch at ({button_x}, {button_y}): {avg_color_int} vs {target_color}")
+                self.logger.debug("Accept button match ratio at (%d, %d): %.2f", button_x, button_y, ratio)
 
-            return is_similar
+            return ratio
 
         except Exception as e:
-            self.logger.error(f"Error verifying Accept button color: {e}")
-            return False
\ No newline at end of file
+            self.logger.error(f"Error sampling Accept button region: {e}")
+            return None
@@ -160,9 +160,9 @@ class WeaponDetectionService:
             if success:
                 # Only log weapon switches, not reconfirmations
                 if new_weapon != self.detection_state.previous_weapon:
-                    self.logger.debug(f"Auto-switched to weapon: {new_weapon}")
+                    self.logger.debug("Auto-switched to weapon: %s", new_weapon)
                 else:
-                    self.logger.debug(f"Weapon reconfirmed: {new_weapon}")
+                    self.logger.debug("Weapon reconfirmed: %s", new_weapon)
             else:
                 self.logger.warning(f"Failed to switch to: {new_weapon} (weapon not in profiles)")
         else:
@@ -214,12 +214,12 @@ class WeaponDetectionService:
 
     def _handle_low_ammo_warning(self, weapon: WeaponState) -> None:
         """Handle low ammunition warning silently."""
-        self.logger.debug(f"Low ammo detected: {weapon.name} ({weapon.ammo_clip})")
+        self.logger.debug("Low ammo detected: %s (%s)", weapon.name, weapon.ammo_clip)
         # No TTS announcement to avoid interrupting gameplay
 
     def _handle_empty_magazine(self, weapon: WeaponState) -> None:
         """Handle empty magazine detection silently."""
-        self.logger.debug(f"Empty magazine detected: {weapon.name}")
+        self.logger.debug("Empty magazine detected: %s", weapon.name)
         # No TTS announcement to avoid interrupting gameplay
 
     def configure(self, config: Dict[str, Any]) -> bool:
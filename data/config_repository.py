@@ -69,6 +69,9 @@ class ConfigRepository:
     def __init__(self, config_file: str = "config.json"):
         self.logger = logging.getLogger("ConfigRepository")
         self.config_file = config_file
+        # Serialized text and file mtime of the last successful write
+        self._last_saved_text: Optional[str] = None
+        self._last_saved_mtime_ns: Optional[int] = None
         self.logger.info(f"Config repository initialized (file: {config_file})")
 
     def load_config(self) -> Dict[str, Any]:
@@ -143,10 +146,21 @@ class ConfigRepository:
     def save_config(self, config: Dict[str, Any]) -> bool:
         """Save configuration to JSON file."""
         try:
+            text = json.dumps(config, indent=4, ensure_ascii=False)
+
+            # Skip the write when nothing changed since our last save and the
+            # file has not been modified by anyone else in the meantime
+            if text == self._last_saved_text and \
+                    self._file_mtime_ns() == self._last_saved_mtime_ns:
+                self.logger.debug("Configuration unchanged, skipping write")
+                return True
+
             # Save configuration directly (no backup creation)
             with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=4, ensure_ascii=False)
+                f.write(text)
 
+            self._last_saved_text = text
+            self._last_saved_mtime_ns = self._file_mtime_ns()
             self.logger.debug("Configuration saved successfully")
             return True
 
@@ -160,6 +174,13 @@ class ConfigRepository:
             self.logger.critical(f"Unexpected error saving configuration: {e}", exc_info=True)
             return False
 
+    def _file_mtime_ns(self) -> Optional[int]:
+        """Return the configuration file modification time, or None if missing."""
+        try:
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
 
 class CSVRepository:
     """Repository for CSV pattern file management."""
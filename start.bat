@@ -2,7 +2,7 @@
 setlocal enabledelayedexpansion
 
 :: --- Configuration ---
-set "PYTHON_MIN_VERSION=3.9"
+set "PYTHON_MIN_VERSION=3.10"
 set "REQUIRED_FILE=requirements.txt"
 set "MAIN_SCRIPT=main.py"
 
@@ -745,6 +745,10 @@ class MainWindow(QMainWindow):
             else:
                 self.auto_accept_service.disable()
 
+        if self.bomb_timer_service:
+            # Stops a running countdown right away when the feature is turned off
+            self.bomb_timer_service.check_config_and_update()
+
         if self.follow_rcs_overlay:
             follow_rcs_enabled = features.get("follow_rcs_enabled", False)
             self.follow_rcs_overlay.set_active(follow_rcs_enabled)
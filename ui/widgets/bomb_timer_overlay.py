@@ -73,7 +73,8 @@ class BombTimerOverlay(QWidget):
 
     def update_bomb_state(self, remaining_time: float, has_defuse_kit: bool, can_defuse: bool):
         """Update bomb timer state."""
-        self.logger.debug(f"Overlay update: time={remaining_time:.1f}, kit={has_defuse_kit}, can_defuse={can_defuse}")
+        self.logger.debug("Overlay update: time=%.1f, kit=%s, can_defuse=%s",
+                          remaining_time, has_defuse_kit, can_defuse)
 
         self.remaining_time = remaining_time
         self.has_defuse_kit = has_defuse_kit